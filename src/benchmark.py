@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Benchmark harness: tree build, proofs, Lamport keys, Merkle signatures and transport.
+  Created:  18/10/2026
+  Note:     Run 'python benchmark.py --help' for the options, results are saved as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import threading
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from benchmark_merkle_tree import filled_tree
+from benchmark_wire_format import sample_signature
+from lamport import LamportSignature
+from merkle_tree import MerkleTree
+from verification_client import BlockingVerificationClient
+from verification_server import VerificationServer
+from wire_format import encode_signature
+
+
+SIZES = [4, 8, 12, 16, 20, 22]  # log2 of the numbers of leaves of the tree scenarios.
+PERCENTILES = [50, 90, 99]
+
+
+class Scenario:
+    """Benchmark scenario: an operation timed many times on a state set up once.
+
+    Attributes:
+        name (str): Scenario name.
+        params (dict): Scenario parameters, saved with the results.
+        setup (callable): Create the state, not timed.
+        prepare (None/callable): Create the argument of one operation from the state, not timed.
+        operation (callable): Operation timed, called with the state and the prepared argument.
+        teardown (None/callable): Release the state.
+        max_repeat (None/int): Largest number of timed operations, e.g. the one-time keys available.
+
+    """
+
+    def __init__(self, name, params, setup, operation, prepare=None, teardown=None, max_repeat=None):
+        """Scenario object constructor, see the class attributes."""
+        self.name = name
+        self.params = params
+        self.setup = setup
+        self.operation = operation
+        self.prepare = prepare
+        self.teardown = teardown
+        self.max_repeat = max_repeat
+
+
+def percentile(latencies, p):
+    """Nearest-rank percentile.
+
+    Args:
+        latencies (list): Sorted values.
+        p (float): Percentile, from 0 to 100.
+
+    Returns:
+        (float): Value below which p % of the values are.
+
+    """
+    return latencies[max(0, min(len(latencies) - 1, math.ceil(p / 100 * len(latencies)) - 1))]
+
+
+def run_scenario(scenario, repeat, warmup=1):
+    """Run a scenario.
+
+    Each operation is timed on its own. The peak memory is measured with tracemalloc on one
+    more operation, including its preparation, after the timed ones since tracing slows
+    Python down.
+
+    Args:
+        scenario (Scenario): Scenario.
+        repeat (int): Number of timed operations, at most scenario.max_repeat.
+        warmup (int): Number of operations run before the timed ones.
+
+    Returns:
+        (dict): Name, parameters, number of operations, operations per second, latency
+            statistics in seconds and peak memory in bytes.
+
+    """
+    if scenario.max_repeat is not None:
+        repeat = max(1, min(repeat, scenario.max_repeat - warmup - 1))
+    state = scenario.setup()
+    try:
+        latencies = []
+        for i in range(warmup + repeat):
+            arg = None if scenario.prepare is None else scenario.prepare(state)
+            start = perf_counter()
+            scenario.operation(state, arg)
+            elapsed = perf_counter() - start
+            if i >= warmup:
+                latencies.append(elapsed)
+        tracemalloc.start()
+        try:
+            scenario.operation(state, None if scenario.prepare is None else scenario.prepare(state))
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        if scenario.teardown is not None:
+            scenario.teardown(state)
+    latencies.sort()
+    latency = {'mean': sum(latencies) / len(latencies), 'min': latencies[0], 'max': latencies[-1]}
+    latency.update(('p{}'.format(p), percentile(latencies, p)) for p in PERCENTILES)
+    return {'name': scenario.name, 'params': scenario.params, 'repeat': repeat,
+            'ops_per_sec': len(latencies) / sum(latencies), 'latency': latency, 'peak_memory': peak_memory}
+
+
+def generated_tree(n_leaves):
+    mk = filled_tree(n_leaves)
+    mk.generate_tree()
+    return mk
+
+
+def tree_scenarios(sizes):
+    """generate_tree(), auth path extraction and verification for trees of 2^size leaves."""
+    scenarios = []
+    for size in sizes:
+        n_leaves = 2 ** size
+        params = {'n_leaves': n_leaves}
+        scenarios.append(Scenario(
+            'generate_tree', params, setup=lambda: None,
+            prepare=lambda state, n_leaves=n_leaves: filled_tree(n_leaves),
+            operation=lambda state, mk: mk.generate_tree(),
+            max_repeat=max(5, 2 ** 20 // n_leaves)))
+        scenarios.append(Scenario(
+            'auth_path', params, setup=lambda n_leaves=n_leaves: generated_tree(n_leaves),
+            prepare=lambda mk: random.randrange(mk.n_leaves),
+            operation=lambda mk, index: mk.get_authentification_path_hashes(index)))
+        scenarios.append(Scenario(
+            'verify_auth_path', params, setup=lambda n_leaves=n_leaves: generated_tree(n_leaves),
+            prepare=lambda mk: random.randrange(mk.n_leaves),
+            operation=lambda mk, index: mk.verify_auth_path(
+                mk.tree[0, index], index, mk.get_authentification_path_hashes(index), mk.tree[mk.n_levels - 1, 0])))
+    return scenarios
+
+
+def lamport_scenarios():
+    """Lamport key generation, signature and verification."""
+    msg = "Ceci est un message test"
+
+    def signed():
+        key = LamportSignature()
+        return key, key.sign(msg)
+
+    return [
+        Scenario('lamport_keygen', {}, setup=lambda: None, operation=lambda state, arg: LamportSignature()),
+        Scenario('lamport_sign', {}, setup=lambda: None, prepare=lambda state: LamportSignature(),
+                 operation=lambda state, key: key.sign(msg)),
+        Scenario('lamport_verify', {}, setup=signed,
+                 operation=lambda state, arg: LamportSignature.verify(msg, state[1], state[0].public_key_buffer)),
+    ]
+
+
+def mss_scenario(n_leaves):
+    """Merkle signature and its verification, as main.py does, with the keys of a tree of 'n_leaves' leaves."""
+    msg = "test"
+
+    def setup():
+        keys = LamportSignature.generate_keys(n_leaves)
+        mk = MerkleTree(n_leaves=n_leaves)
+        mk.add_leaves([key.public_key_buffer for key in keys])
+        mk.generate_tree()
+        return {'keys': keys, 'tree': mk, 'root': mk.get_root(), 'next': 0}
+
+    def prepare(state):
+        state['next'] += 1
+        return state['next'] - 1
+
+    def sign_verify(state, index):
+        key = state['keys'][index]
+        sig = [key.sign(msg), key.get_key('public', concatenate=True), state['tree'].get_authentification_path_hashes(index)]
+        if not (LamportSignature.verify(msg, sig[0], sig[1]) and
+                MerkleTree.verify_auth_path(MerkleTree.hash(sig[1]), index, sig[2], state['root'])):
+            raise ValueError("Merkle signature rejected.")
+
+    return Scenario('mss_sign_verify', {'n_leaves': n_leaves}, setup=setup, prepare=prepare,
+                    operation=sign_verify, max_repeat=n_leaves)
+
+
+def round_trip_scenario(n_leaves):
+    """One signature verified by a localhost VerificationServer and its answer, request by request."""
+
+    def setup():
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        server = VerificationServer(port=0, workers=1)
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+        client = BlockingVerificationClient(server.host, server.port, size=1)
+        data = encode_signature(*sample_signature(n_leaves))
+        return {'loop': loop, 'thread': thread, 'server': server, 'client': client, 'data': data}
+
+    def round_trip(state, arg):
+        if not state['client'].submit(state['data']).result():
+            raise ValueError("Signature rejected by the server.")
+
+    def teardown(state):
+        state['client'].close()
+        asyncio.run_coroutine_threadsafe(state['server'].close(), state['loop']).result()
+        state['loop'].call_soon_threadsafe(state['loop'].stop)
+        state['thread'].join()
+        state['loop'].close()
+
+    return Scenario('round_trip', {'n_leaves': n_leaves}, setup=setup, operation=round_trip, teardown=teardown)
+
+
+def all_scenarios(sizes):
+    """Every scenario, the tree ones for trees of 2^size leaves for each size of 'sizes'."""
+    return tree_scenarios(sizes) + lamport_scenarios() + [mss_scenario(1024), round_trip_scenario(1024)]
+
+
+def compare(results, previous):
+    """Print the throughput of each scenario relative to a previous run.
+
+    Args:
+        results (list): Results of this run, see run_scenario().
+        previous (list): Results of the previous run.
+
+    """
+    before = {(i['name'], json.dumps(i['params'], sort_keys=True)): i for i in previous}
+    for result in results:
+        old = before.get((result['name'], json.dumps(result['params'], sort_keys=True)))
+        if old is not None:
+            print("{:>17} {:<20} {:>7.2f}x".format(result['name'], json.dumps(result['params']),
+                                                 result['ops_per_sec'] / old['ops_per_sec']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark scenarios and save the results as JSON.")
+    parser.add_argument('--scenario', action='append', help="Scenario to run (repeatable), all of them by default.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help="log2 of the numbers of leaves of the trees.")
+    parser.add_argument('--repeat', type=int, default=100, help="Number of timed operations per scenario.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the leaves picked by the proof scenarios.")
+    parser.add_argument('--output', default="benchmark_results.json", help="JSON file the results are saved to.")
+    parser.add_argument('--compare', help="JSON file of a previous run to compare the throughputs with.")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    scenarios = [i for i in all_scenarios(args.sizes) if args.scenario is None or i.name in args.scenario]
+    results = []
+    for scenario in scenarios:
+        result = run_scenario(scenario, args.repeat)
+        results.append(result)
+        latency = result['latency']
+        print("{:>17} {:<20} {:>12,.1f} ops/s  p50 {:.3g} s  p99 {:.3g} s  peak {:,} B".format(
+            result['name'], json.dumps(result['params']), result['ops_per_sec'],
+            latency['p50'], latency['p99'], result['peak_memory']))
+
+    report = {'created': datetime.now(timezone.utc).isoformat(), 'python': platform.python_version(),
+              'platform': platform.platform(), 'cpu_count': os.cpu_count(), 'args': vars(args), 'results': results}
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)['results'])
+
+
+if __name__ == "__main__":
+    main()
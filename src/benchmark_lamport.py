@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Lamport signature benchmarks.
+  Created:  18/10/2026
+"""
+
+import os
+from time import perf_counter
+from lamport import LamportSignature
+
+
+def benchmark_generate_keys(count, workers_list):
+    """Compare the key generation throughput of the constructor and generate_keys().
+
+    Args:
+        count (int): Number of key pairs.
+        workers_list (list): Numbers of workers to try with generate_keys().
+
+    Returns:
+        (dict): Key pairs per second for each generation path.
+
+    """
+    results = {}
+    start = perf_counter()
+    [LamportSignature() for _ in range(count)]
+    results['LamportSignature()'] = count / (perf_counter() - start)
+    for workers in workers_list:
+        start = perf_counter()
+        LamportSignature.generate_keys(count, workers=workers)
+        results['generate_keys(workers={})'.format(workers)] = count / (perf_counter() - start)
+    return results
+
+
+def main():
+    count = 1024
+    workers_list = sorted(set(w for w in (1, 2, 4, os.cpu_count()) if w <= os.cpu_count()))
+    print("Lamport key generation, {} key pairs".format(count))
+    for path, throughput in benchmark_generate_keys(count, workers_list).items():
+        print("{:>26}: {:,.0f} keys/s".format(path, throughput))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Merkle tree benchmarks.
+  Created:  18/10/2026
+"""
+
+import os
+from time import perf_counter
+from hash_functions import ALGORITHMS
+from merkle_tree import MerkleTree
+
+
+def filled_tree(n_leaves, hash_function=None):
+    """Create a tree whose leaves are all known.
+
+    Args:
+        n_leaves (int): Number of leaves in the tree.
+        hash_function (None/str/HashFunction): Hash function of the tree.
+
+    Returns:
+        (MerkleTree): Tree, not generated yet.
+
+    """
+    mk = MerkleTree(n_leaves=n_leaves, hash_function=hash_function)
+    mk.add_leaves(str(i) for i in range(n_leaves))
+    return mk
+
+
+def benchmark_parallel_build(n_leaves, workers_list):
+    """Time generate_tree() for several numbers of workers.
+
+    Args:
+        n_leaves (int): Number of leaves in the tree.
+        workers_list (list): Numbers of workers to try, 1 is the serial build.
+
+    Returns:
+        (dict): Build time in seconds for each number of workers.
+
+    """
+    results = {}
+    root = None
+    for workers in workers_list:
+        mk = filled_tree(n_leaves)
+        start = perf_counter()
+        mk.generate_tree(workers=workers)
+        results[workers] = perf_counter() - start
+        if root is not None and mk.get_root() != root:
+            raise ValueError("Parallel and serial roots differ.")
+        root = mk.get_root()
+    return results
+
+
+def benchmark_add_leaves(n_leaves):
+    """Compare the leaf ingestion throughput of add_node() and add_leaves().
+
+    Args:
+        n_leaves (int): Number of leaves in the tree.
+
+    Returns:
+        (dict): Leaves per second for each ingestion path.
+
+    """
+    data = [str(i) for i in range(n_leaves)]
+    hashes = b"".join(MerkleTree.hash(i) for i in data)
+    results = {}
+
+    mk = MerkleTree(n_leaves=n_leaves)
+    start = perf_counter()
+    for i in range(n_leaves):
+        mk.add_node(data[i], (0, i))
+    results['add_node'] = n_leaves / (perf_counter() - start)
+
+    mk = MerkleTree(n_leaves=n_leaves)
+    start = perf_counter()
+    mk.add_leaves(data)
+    results['add_leaves'] = n_leaves / (perf_counter() - start)
+
+    mk = MerkleTree(n_leaves=n_leaves)
+    start = perf_counter()
+    mk.add_leaves(hashes, hashed=True)
+    results['add_leaves (hashed buffer)'] = n_leaves / (perf_counter() - start)
+    return results
+
+
+def benchmark_hash_functions(n_leaves):
+    """Time generate_tree() with each hash function.
+
+    Args:
+        n_leaves (int): Number of leaves in the tree.
+
+    Returns:
+        (dict): Nodes hashed per second for each hash function.
+
+    """
+    results = {}
+    for name in ALGORITHMS:
+        mk = filled_tree(n_leaves, name)
+        start = perf_counter()
+        mk.generate_tree()
+        results[name] = (n_leaves - 1) / (perf_counter() - start)
+    return results
+
+
+def main():
+    n_leaves = 2 ** 20
+    workers_list = [1, 2, 4, 8, os.cpu_count()]
+    results = benchmark_parallel_build(n_leaves, sorted(set(w for w in workers_list if w <= os.cpu_count())))
+    print("generate_tree(), {} leaves".format(n_leaves))
+    for workers, elapsed in results.items():
+        speedup = results[1] / elapsed
+        print("{:>3} workers: {:.3f} s, speedup {:.2f}, {:.2f} per core".format(
+            workers, elapsed, speedup, speedup / workers))
+
+    print("Leaf ingestion, {} leaves".format(n_leaves))
+    for path, throughput in benchmark_add_leaves(n_leaves).items():
+        print("{:>26}: {:,.0f} leaves/s".format(path, throughput))
+
+    print("generate_tree() per hash function, {} leaves".format(n_leaves))
+    for name, throughput in benchmark_hash_functions(n_leaves).items():
+        print("{:>10}: {:,.0f} nodes/s".format(name, throughput))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Verification server load test.
+  Created:  18/10/2026
+"""
+
+import asyncio
+import os
+from time import perf_counter
+from benchmark_wire_format import sample_signature
+from socket_client_server import FRAME_HEADER
+from verification_server import VerificationServer, REQUEST_HEADER, RESPONSE
+from wire_format import encode_signature
+
+
+async def load_connection(host, port, data, count):
+    """Pipeline 'count' requests on one connection and wait for all the responses.
+
+    Args:
+        host (str): Server address.
+        port (int): Server port.
+        data (bytes-like): Encoded signature sent in every request.
+        count (int): Number of requests.
+
+    Returns:
+        (int): Number of accepted signatures.
+
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    frame = FRAME_HEADER.pack(REQUEST_HEADER.size + len(data))
+
+    async def send():
+        for request_id in range(count):
+            writer.write(frame + REQUEST_HEADER.pack(request_id) + data)
+            await writer.drain()
+
+    sender = asyncio.ensure_future(send())
+    accepted = 0
+    for _ in range(count):
+        await reader.readexactly(FRAME_HEADER.size)
+        request_id, result = RESPONSE.unpack(await reader.readexactly(RESPONSE.size))
+        accepted += result
+    await sender
+    writer.close()
+    await writer.wait_closed()
+    return accepted
+
+
+async def load_test(host, port, data, connections, count):
+    """Measure the verifications per second of a server.
+
+    Args:
+        host (str): Server address.
+        port (int): Server port.
+        data (bytes-like): Encoded signature sent in every request.
+        connections (int): Number of concurrent connections.
+        count (int): Number of requests per connection.
+
+    Returns:
+        (tuple): Verifications per second, number of accepted signatures.
+
+    """
+    start = perf_counter()
+    accepted = await asyncio.gather(*[load_connection(host, port, data, count) for _ in range(connections)])
+    return connections * count / (perf_counter() - start), sum(accepted)
+
+
+async def run(workers, connections, count):
+    server = VerificationServer(port=0, workers=workers)
+    await server.start()
+    try:
+        data = encode_signature(*sample_signature(1024))
+        return await load_test(server.host, server.port, data, connections, count)
+    finally:
+        await server.close()
+
+
+def main():
+    connections, count = 8, 250
+    for workers in sorted(set(w for w in (1, 2, 4, os.cpu_count()) if w <= os.cpu_count())):
+        rate, accepted = asyncio.run(run(workers, connections, count))
+        print("{:>3} workers: {:,.0f} verifications/s, {} accepted".format(workers, rate, accepted))
+
+
+if __name__ == "__main__":
+    main()
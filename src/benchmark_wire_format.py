@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Wire format benchmarks.
+  Created:  18/10/2026
+"""
+
+import pickle
+from time import perf_counter
+from lamport import LamportSignature
+from merkle_tree import MerkleTree
+from wire_format import encode_signature, decode_signature
+
+
+def sample_signature(n_leaves):
+    """Create a Merkle signature as main_client_side.py does.
+
+    Args:
+        n_leaves (int): Number of leaves of the signer tree.
+
+    Returns:
+        (tuple): (n_leaves, index, root, msg, signature).
+
+    """
+    keys = LamportSignature.generate_keys(n_leaves)
+    mk = MerkleTree(n_leaves=n_leaves)
+    mk.add_leaves([i.get_key('public', concatenate=True) for i in keys])
+    mk.generate_tree()
+    signature = [keys[0].sign("test"), keys[0].get_key('public', concatenate=True),
+                 [bytes(i) for i in mk.get_authentification_path_hashes(0)]]
+    return n_leaves, 0, mk.get_root(), "test", signature
+
+
+def benchmark_wire_format(n_leaves, repeat):
+    """Compare the size and throughput of the binary format and pickle.
+
+    Args:
+        n_leaves (int): Number of leaves of the signer tree.
+        repeat (int): Number of encodings and decodings.
+
+    Returns:
+        (dict): Size in bytes, encodings and decodings per second of each format.
+
+    """
+    msg = sample_signature(n_leaves)
+    results = {}
+    for name, encode, decode in (('pickle', pickle.dumps, pickle.loads),
+                                 ('binary', lambda i: encode_signature(*i), decode_signature)):
+        start = perf_counter()
+        for _ in range(repeat):
+            data = encode(msg)
+        encode_rate = repeat / (perf_counter() - start)
+        start = perf_counter()
+        for _ in range(repeat):
+            decode(data)
+        results[name] = (len(data), encode_rate, repeat / (perf_counter() - start))
+    return results
+
+
+def main():
+    n_leaves = 1024
+    print("Merkle signature wire format, {} leaves".format(n_leaves))
+    for name, (size, encode_rate, decode_rate) in benchmark_wire_format(n_leaves, 10000).items():
+        print("{:>6}: {} bytes, {:,.0f} encodings/s, {:,.0f} decodings/s".format(name, size, encode_rate, decode_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Hash functions shared by the Merkle trees and the one-time signatures.
+  Created:  18/10/2026
+"""
+
+import hashlib
+import os
+from functools import partial
+from mmap import mmap as memory_map, ACCESS_READ
+
+
+# Name -> (constructor, full digest size in bytes, digest size set by the constructor itself).
+ALGORITHMS = {
+    'sha256': (hashlib.sha256, 32, False),
+    'sha512_256': (partial(hashlib.new, 'sha512_256'), 32, False),
+    'sha3_256': (hashlib.sha3_256, 32, False),
+    'blake2b': (hashlib.blake2b, 64, True),
+    'blake2s': (hashlib.blake2s, 32, True),
+}
+READ_SIZE = 1 << 20  # Size in bytes of the reads when hashing a file.
+
+
+class HashFunction:
+    """Hash function with a fixed digest size.
+
+    SHA-2 and SHA-3 digests are truncated to 'digest_size' bytes, BLAKE2 digests are
+    computed with that size (so BLAKE2b-256 is not a truncated BLAKE2b-512).
+
+    Attributes:
+        name (str): Algorithm name, a key of ALGORITHMS.
+        digest_size (int): Size in bytes of the digests.
+        new (callable): Create a hash object, whose digest has to go through finalize().
+        digest (callable): Digest of bytes-like data, as bytes.
+
+    """
+
+    def __init__(self, name='sha256', digest_size=32):
+        """HashFunction object constructor.
+
+        Args:
+            name (str): Algorithm name, a key of ALGORITHMS.
+            digest_size (int): Size in bytes of the digests, at most the full digest size.
+
+        """
+        if name not in ALGORITHMS:
+            raise ValueError("Unknown hash function {!r}.".format(name))
+        constructor, full_size, sized = ALGORITHMS[name]
+        if not 0 < digest_size <= full_size:
+            raise ValueError("Wrong digest size for {}.".format(name))
+        self.name = name
+        self.digest_size = digest_size
+        if sized:
+            new = partial(constructor, digest_size=digest_size)
+        else:
+            new = constructor
+        self.new = new
+        if sized or digest_size == full_size:
+            self.digest = lambda data: new(data).digest()
+        else:
+            self.digest = lambda data: new(data).digest()[:digest_size]
+
+    def finalize(self, hash_object):
+        """Digest of a hash object created with new().
+
+        Args:
+            hash_object (hashlib object): Hash object fed with the data.
+
+        Returns:
+            (bytes): Digest, 'digest_size' bytes.
+
+        """
+        return hash_object.digest()[:self.digest_size]
+
+    def __call__(self, data):
+        """Calculate the hash of 'data'.
+
+        Args:
+            (str/bytes-like): Data to hash, str is UTF-8 encoded.
+
+        Returns:
+            (bytearray): bytes of the hash.
+
+        """
+        if type(data) is str:
+            data = data.encode('utf-8')
+        return bytearray(self.digest(data))
+
+    def digest_file(self, file, read_size=READ_SIZE):
+        """Hash a file incrementally, reading it into one reusable buffer.
+
+        Args:
+            file (str/bytes/os.PathLike/file object): Path of the file, or binary file object
+                read from its current position to its end.
+            read_size (int): Size in bytes of the buffer.
+
+        Returns:
+            (bytes): Digest of the file content.
+
+        """
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, 'rb', buffering=0) as f:
+                return self.digest_file(f, read_size)
+        hash_object = self.new()
+        readinto = getattr(file, 'readinto', None)
+        if readinto is None:
+            for chunk in iter(partial(file.read, read_size), b""):
+                hash_object.update(chunk)
+            return self.finalize(hash_object)
+        buffer = bytearray(read_size)
+        with memoryview(buffer) as view:
+            while True:
+                count = readinto(buffer)
+                if not count:
+                    break
+                hash_object.update(view[:count])
+        return self.finalize(hash_object)
+
+    def digest_chunks(self, chunks):
+        """Hash the concatenation of chunks, consumed lazily.
+
+        Args:
+            chunks (iterable): Chunks (str/bytes-like), str is UTF-8 encoded.
+
+        Returns:
+            (bytes): Digest of the concatenated chunks.
+
+        """
+        hash_object = self.new()
+        for chunk in chunks:
+            hash_object.update(chunk.encode('utf-8') if type(chunk) is str else chunk)
+        return self.finalize(hash_object)
+
+    def hash_message(self, msg):
+        """Calculate the hash of a message held in memory, in a file or in chunks.
+
+        Args:
+            msg (str/bytes-like/os.PathLike/file object/iterable): Message, path of a file
+                holding it (not a plain str, which is the message itself), binary file object
+                or chunks, see digest_file() and digest_chunks().
+
+        Returns:
+            (bytearray): bytes of the hash.
+
+        """
+        if type(msg) is str:
+            return bytearray(self.digest(msg.encode('utf-8')))
+        if isinstance(msg, os.PathLike):
+            return bytearray(self.digest_file(msg))
+        try:
+            memoryview(msg)
+        except TypeError:
+            pass
+        else:
+            return bytearray(self.digest(msg))
+        if hasattr(msg, 'read'):
+            return bytearray(self.digest_file(msg))
+        return bytearray(self.digest_chunks(msg))
+
+    def __eq__(self, other):
+        return isinstance(other, HashFunction) and (self.name, self.digest_size) == (other.name, other.digest_size)
+
+    def __hash__(self):
+        return hash((self.name, self.digest_size))
+
+    def __repr__(self):
+        return "HashFunction({!r}, {})".format(self.name, self.digest_size)
+
+    def __reduce__(self):
+        return HashFunction, (self.name, self.digest_size)
+
+
+SHA256 = HashFunction()  # Default hash function.
+
+
+def get_hash_function(hash_function=None, digest_size=32):
+    """Get a hash function from its name.
+
+    Args:
+        hash_function (None/str/HashFunction): Algorithm name or hash function, SHA256 if None.
+        digest_size (int): Size in bytes of the digests when 'hash_function' is a name.
+
+    Returns:
+        (HashFunction): Hash function.
+
+    """
+    if hash_function is None:
+        return SHA256
+    if isinstance(hash_function, HashFunction):
+        return hash_function
+    return HashFunction(hash_function, digest_size)
+
+
+def chunk_hashes(path, chunk_size=4096, hash_function=None, mmap=True, batch_size=1024):
+    """Hash a file by fixed-size chunks, the last one being possibly shorter.
+
+    The file is never held in memory as a whole: it is either mapped in memory, letting the
+    system page it in and out, or read into one buffer of 'batch_size' chunks.
+
+    Args:
+        path (str/bytes/os.PathLike): Path of the file.
+        chunk_size (int): Size in bytes of a chunk.
+        hash_function (None/str/HashFunction): Hash function, see get_hash_function().
+        mmap (boolean): Map the file in memory instead of reading it.
+        batch_size (int): Number of chunk hashes yielded at once.
+
+    Yields:
+        (bytes): Contiguous hashes of the next chunks, at most 'batch_size' of them.
+
+    """
+    digest = get_hash_function(hash_function).digest
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        step = chunk_size * batch_size
+        if mmap and size:
+            with memory_map(f.fileno(), 0, access=ACCESS_READ) as data, memoryview(data) as view:
+                for i in range(0, size, step):
+                    with view[i:i + step] as batch:
+                        yield b"".join([digest(batch[j:j + chunk_size]) for j in range(0, len(batch), chunk_size)])
+            return
+        buffer = bytearray(step)
+        with memoryview(buffer) as view:
+            while True:
+                count = 0
+                while count < step:  # Short reads would shift the chunk boundaries.
+                    read = f.readinto(view[count:])
+                    if not read:
+                        break
+                    count += read
+                if count:
+                    yield b"".join([digest(view[j:min(j + chunk_size, count)]) for j in range(0, count, chunk_size)])
+                if count < step:
+                    break
+
+
+def main():
+    for name in ALGORITHMS:
+        print(name, get_hash_function(name)("abc").hex())
+
+
+if __name__ == "__main__":
+    main()
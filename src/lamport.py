@@ -5,36 +5,207 @@
   Created:  20/04/2017
 """
 
-from bitstring import BitArray
-import hashlib
+import hmac
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from os import urandom
+from hash_functions import SHA256, get_hash_function
+
+
+KEY_SIZE = 16384  # Public/private key size 2×256×256 bits.
+SIGNATURE_SIZE = 8192  # Signature size 256×256 bits.
+PRF_INPUT = struct.Struct('>QHB')  # Key index, position in the key, bit.
+BYTE_BITS = [tuple((byte >> (7 - i)) & 1 for i in range(8)) for byte in range(256)]  # Bits of each byte value.
+
+
+def generate_key_buffers(count, hash_function=SHA256):
+    """Generate 'count' key pairs as two contiguous buffers.
+
+    Args:
+        count (int): Number of key pairs.
+        hash_function (HashFunction): Hash function deriving the public keys.
+
+    Returns:
+        (tuple): Concatenated private keys and concatenated public keys, count×16 KiB each.
+
+    """
+    private_keys = urandom(count * KEY_SIZE)
+    return private_keys, hash_private_keys(private_keys, hash_function)
+
+
+def hash_private_keys(private_keys, hash_function=SHA256):
+    """Compute the public keys of concatenated private keys.
+
+    Args:
+        private_keys (bytes-like): Concatenated private keys.
+        hash_function (HashFunction): Hash function deriving the public keys.
+
+    Returns:
+        (bytes): Concatenated public keys.
+
+    """
+    view = memoryview(private_keys)
+    digest = hash_function.digest
+    return b"".join([digest(view[i:i + 32]) for i in range(0, len(view), 32)])
+
+
+def derive_private_half(seed, index, position, bit):
+    """Derive one half of a private key pair from a master seed.
+
+    The half is PRF(seed, index‖position‖bit) with HMAC-SHA256 as the PRF.
+
+    Args:
+        seed (bytes-like): Master seed.
+        index (int): Key index.
+        position (int): Position of the pair in the key (from 0 to 255).
+        bit (int): 0 for the first half of the pair, 1 for the second one.
+
+    Returns:
+        (bytearray): Private key half, 256 bits.
+
+    """
+    return bytearray(hmac.digest(seed, PRF_INPUT.pack(index, position, bit), 'sha256'))
+
+
+def derive_private_key(seed, index):
+    """Derive a whole private key from a master seed, see derive_private_half().
+
+    Args:
+        seed (bytes-like): Master seed.
+        index (int): Key index.
+
+    Returns:
+        (bytearray): Concatenated private key, 16 KiB.
+
+    """
+    pack = PRF_INPUT.pack
+    return bytearray(b"".join([hmac.digest(seed, pack(index, position, bit), 'sha256')
+                               for position in range(256) for bit in (0, 1)]))
 
 
 class LamportSignature:
     """Lamport signature class.
     
     Attributes:
-        private_key (list): Private key.
-        public_key (list): Public key.
+        private_key_buffer (None/bytearray): Concatenated private key, None if derived from a seed.
+        public_key_buffer (bytearray): Concatenated public key.
+        seed (None/bytes): Master seed the private key is derived from.
+        index (int): Key index used with 'seed'.
+        hash_function (HashFunction): Hash function of the public key and of the messages.
         used (boolean): Keys already used to sign a message.
         
     """
 
-    def __init__(self):
-        """ LamportSignature object constructor"""
-        self.private_key = self.generate_private_key()
-        self.public_key = self.generate_public_key()
+    def __init__(self, private_key=None, public_key=None, seed=None, index=0, hash_function=None):
+        """ LamportSignature object constructor
+        
+        Args:
+            private_key (list/bytes-like): Existing private key, generated if None.
+            public_key (list/bytes-like): Public key of 'private_key', computed if None.
+            seed (bytes-like): Master seed, the private key is then derived on demand
+                from it and 'index' and never stored.
+            index (int): Key index used with 'seed'.
+            hash_function (None/str/HashFunction): Hash function with 256-bit digests,
+                see hash_functions.get_hash_function().
+        
+        """
+        self.hash_function = self.check_hash_function(hash_function)
+        self.seed = None if seed is None else bytes(seed)
+        self.index = index
+        self.private_key_list = None
         self.used = False
+        if seed is not None:
+            self.private_key_buffer = None
+            if public_key is None:
+                public_key = hash_private_keys(derive_private_key(self.seed, index), self.hash_function)
+            elif type(public_key) is list:
+                public_key = self.concatenate_key(public_key)
+            self.public_key_buffer = bytearray(public_key)
+            self.public_key_list = None
+            return
+        if private_key is None:
+            private_key, public_key = generate_key_buffers(1, self.hash_function)
+        if type(private_key) is list:
+            private_key = self.concatenate_key(private_key)
+        self.private_key_buffer = bytearray(private_key)
+        if public_key is None:
+            public_key = self.concatenate_key(self.generate_public_key())
+        elif type(public_key) is list:
+            public_key = self.concatenate_key(public_key)
+        self.public_key_buffer = bytearray(public_key)
+        self.public_key_list = None
+
+    @property
+    def private_key(self):
+        """(list): Private key, decatenated from 'private_key_buffer' on first access."""
+        if self.seed is not None:
+            return self.decatenate_key(derive_private_key(self.seed, self.index))
+        if self.private_key_list is None:
+            self.private_key_list = self.decatenate_key(self.private_key_buffer)
+        return self.private_key_list
+
+    @property
+    def public_key(self):
+        """(list): Public key, decatenated from 'public_key_buffer' on first access."""
+        if self.public_key_list is None:
+            self.public_key_list = self.decatenate_key(self.public_key_buffer)
+        return self.public_key_list
+
+    @classmethod
+    def generate_keys(cls, count, workers=1, hash_function=None):
+        """Generate 'count' key pairs at once, drawing the randomness and hashing in bulk.
+        
+        Args:
+            count (int): Number of key pairs.
+            workers (int): Number of processes sharing the work.
+            hash_function (None/str/HashFunction): Hash function of the keys.
+        
+        Returns:
+            (list): LamportSignature objects.
+        
+        """
+        hash_function = cls.check_hash_function(hash_function)
+        if workers > 1:
+            counts = [count // workers + (i < count % workers) for i in range(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                buffers = list(executor.map(partial(generate_key_buffers, hash_function=hash_function),
+                                            [i for i in counts if i]))
+        else:
+            buffers = [generate_key_buffers(count, hash_function)]
+        keys = []
+        for private_keys, public_keys in buffers:
+            private_keys, public_keys = memoryview(private_keys), memoryview(public_keys)
+            for i in range(0, len(private_keys), KEY_SIZE):
+                keys.append(cls(private_keys[i:i + KEY_SIZE], public_keys[i:i + KEY_SIZE],
+                                hash_function=hash_function))
+        return keys
 
     @staticmethod
-    def generate_private_key():
+    def check_hash_function(hash_function):
+        """Get a hash function usable for the keys, whose digests are 256 bits long.
+
+        Args:
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+        Returns:
+            (HashFunction): Hash function.
+
+        """
+        hash_function = get_hash_function(hash_function)
+        if hash_function.digest_size != 32:
+            raise ValueError("Lamport keys need a hash function with 256-bit digests.")
+        return hash_function
+
+    @classmethod
+    def generate_private_key(cls):
         """Generate a private key.
         
         Returns:
             (list): Private key, 2×256×256 bits = 16 KiB.
 
         """
-        return [(bytearray(urandom(32)), bytearray(urandom(32))) for i in range(256)]
+        return cls.decatenate_key(bytearray(urandom(KEY_SIZE)))
 
     def generate_public_key(self):
         """Generate a public key.
@@ -43,7 +214,7 @@ class LamportSignature:
             (list): Public key, 2×256×256 bits = 16 KiB.
         
         """
-        return [(self.hash(a), self.hash(b)) for (a, b) in self.private_key]
+        return [(self.hash_function(a), self.hash_function(b)) for (a, b) in self.private_key]
 
     @staticmethod
     def concatenate_key(key_list):
@@ -76,13 +247,11 @@ class LamportSignature:
             (list): Decatenated key.
             
         """
-        if len(key) == 8192:  # signature key size 256×256 bits
-            return [key[i:i + 32] for i in range(0, 8192, 32)]
-        elif len(key) == 16384:  # public/private key size 2x256×256 bits
-            ret = []
-            for i in range(0, 16384, 64):
-                ret.append((key[i:i + 32], key[i + 32:i + 64]))
-            return ret
+        if len(key) == SIGNATURE_SIZE:
+            return [key[i:i + 32] for i in range(0, SIGNATURE_SIZE, 32)]
+        elif len(key) == KEY_SIZE:
+            halves = [key[i:i + 32] for i in range(0, KEY_SIZE, 32)]
+            return list(zip(halves[0::2], halves[1::2]))
         else:
             raise ValueError("Wrong key size.")
 
@@ -97,16 +266,18 @@ class LamportSignature:
             (bytearray/list): Public key.
         
         """
-        key = self.public_key if key_type == 'public' else self.private_key
-        if not concatenate:
-            return key
-        return self.concatenate_key(key)
+        if concatenate and key_type != 'public' and self.seed is not None:
+            return derive_private_key(self.seed, self.index)
+        if concatenate:
+            return bytearray(self.public_key_buffer if key_type == 'public' else self.private_key_buffer)
+        return self.public_key if key_type == 'public' else self.private_key
 
     def sign(self, msg):
         """Sign a message with the Lamport signature.
         
         Args:
-            msg (str): Message to sign.
+            msg (str/bytes-like/os.PathLike/file object/iterable): Message to sign, or a file
+                or chunks hashed incrementally, see HashFunction.hash_message().
         
         Returns:
             (list): Signature of the message, sequence of 256 random numbers, 256×256 bits.
@@ -115,49 +286,76 @@ class LamportSignature:
         if self.used:
             raise ValueError("Private and public keys already used!")
         self.used = True
-        msg_hash = self.hash(msg)
-        signature = []
-        for (a, b), bit in zip(self.private_key, BitArray(bytes=msg_hash).bin):
-            if bit == "0":
-                signature.append(a)
-            elif bit == "1":
-                signature.append(b)
-        return signature
+        bits = self.message_bits(msg, self.hash_function)
+        if self.seed is not None:
+            return [derive_private_half(self.seed, self.index, position, bit) for position, bit in enumerate(bits)]
+        key = self.private_key_buffer
+        return [key[(2 * position + bit) * 32:(2 * position + bit + 1) * 32] for position, bit in enumerate(bits)]
 
     @classmethod
-    def verify(cls, msg, signature, public_key):
+    def verify(cls, msg, signature, public_key, hash_function=None):
         """Verify signature of the message.
         
+        The check stops at the first signature part that does not match the public key.
+        
         Args:
-            msg (str): Message to check.
-            signature (list): Signature of the message, sequence of 256 random numbers, 256×256 bits.
-            public_key (list): Public key, 2×256×256 bits.
+            msg (str/bytes-like/os.PathLike/file object/iterable): Message to check, see sign().
+            signature (list/bytes-like): Signature of the message, sequence of 256 random numbers,
+                256×256 bits, as a list or a contiguous buffer.
+            public_key (list/bytes-like): Public key, 2×256×256 bits, as a list or a contiguous buffer.
+            hash_function (None/str/HashFunction): Hash function of the key, sha256 if None.
         
         Returns:
             (boolean): True if signature of the message is right otherwise False.
         
         """
-        msg_hash = cls.hash(msg)
-        signature_hash = [cls.hash(i) for i in signature]
-        for sig_hash, (a, b), bit in zip(signature_hash, public_key, BitArray(bytes=msg_hash).bin):
-            if (bit == "0" and sig_hash != a) or (bit == "1" and sig_hash != b):
+        signature_view = None if type(signature) is list else memoryview(signature)
+        public_view = None if type(public_key) is list else memoryview(public_key)
+        if len(signature) != (256 if signature_view is None else SIGNATURE_SIZE):
+            return False
+        if len(public_key) != (256 if public_view is None else KEY_SIZE):
+            return False
+        hash_function = get_hash_function(hash_function)
+        digest = hash_function.digest
+        for position, bit in enumerate(cls.message_bits(msg, hash_function)):
+            if signature_view is None:
+                part = signature[position]
+            else:
+                part = signature_view[position * 32:(position + 1) * 32]
+            if public_view is None:
+                expected = public_key[position][bit]
+            else:
+                expected = public_view[(2 * position + bit) * 32:(2 * position + bit + 1) * 32]
+            if digest(part) != expected:
                 return False
         return True
 
+    @classmethod
+    def message_bits(cls, msg, hash_function=None):
+        """Bits of the hash of the message, most significant bit of each byte first.
+        
+        Args:
+            msg (str/bytes-like/os.PathLike/file object/iterable): Message, see sign().
+            hash_function (None/str/HashFunction): Hash function of the key, sha256 if None.
+        
+        Returns:
+            (list): 256 bits (0 or 1).
+        
+        """
+        return [bit for byte in get_hash_function(hash_function).hash_message(msg) for bit in BYTE_BITS[byte]]
+
     @staticmethod
     def hash(data):
-        """Calculate sha256 hash of 'data'.
+        """Calculate sha256 hash of 'data', see 'hash_function' for the hash of a given key.
         
         Args:
-            (str/bytearray): Data to hash.
+            (str/bytes-like): Data to hash.
 
         Returns:
             (bytearray): bytes of the hash.
 
         """
-        if type(data) is not bytearray:
-            data = data.encode('utf-8')
-        return bytearray(hashlib.sha256(data).digest())
+        return SHA256(data)
 
 
 def main():
@@ -50,17 +50,10 @@ def main():
 
     # If 'sig_prime' is a valid signature of 'M', the receiver computes the leaf corresponding to the Lamport key 'Yi'.
     if result:
-        mk_receiver = MerkleTree(n_leaves=N)
-        mk_receiver.add_node(sig_receiver[1], (0, pair), hashed=False)
-        mk_receiver.generate_tree()
+        leaf = MerkleTree.hash(sig_receiver[1])
 
-        # The nodes of the authentification path are computed.
-        for i, (level, index) in enumerate(mk_receiver.get_authentification_path(pair)):
-            mk_receiver.add_node(sig_receiver[2][i], (level, index), hashed=True)
-        mk_receiver.generate_tree()
-
-        # If the tree's root equals the public key 'pub' the signature is valid.
-        result = mk_receiver.get_root() == pub_receiver
+        # If the authentification path leads from the leaf to the public key 'pub' the signature is valid.
+        result = MerkleTree.verify_auth_path(leaf, pair, sig_receiver[2], pub_receiver)
         print("Merkle signature is: " + str(result))
 
 
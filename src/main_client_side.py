@@ -6,10 +6,10 @@
   Note:     Run 'main_server_side.py' before running this file.
 """
 
-import pickle
 from socket_client_server import Client
 from lamport import LamportSignature
 from merkle_tree import MerkleTree
+from wire_format import encode_signature
 
 
 def main():
@@ -40,8 +40,7 @@ def main():
 
     # Send to receiver the public key 'pub' (tree root), the message 'M' and the Merkle signature 'sig'.
     client = Client()
-    msg = (N, pair, pub, M, sig)
-    client.send(pickle.dumps(msg))
+    client.send_message(encode_signature(N, pair, pub, M, sig))
     client.close()
 
 
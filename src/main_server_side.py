@@ -6,40 +6,32 @@
   Note:     Run this file before running 'main_client_side.py'.
 """
 
-import pickle
 from socket_client_server import Server
 from lamport import LamportSignature
 from merkle_tree import MerkleTree
+from wire_format import decode_signature
 
 
 def main():
     # Merkle signature verification.
     server = Server()
-    data = server.receive()
+    data = server.receive_message()
     server.close()
-    data = pickle.loads(data)
 
     # Receiver knows the public key 'pub' (tree root), the message 'M' and the Merkle signature 'sig'.
-    N, pair, pub_receiver, M_receiver, sig_receiver = data
+    N, pair, pub_receiver, M_receiver, sig_receiver = decode_signature(data)
 
     # First, the receiver verifies the one time signature 'sig_prime' of the message 'M' using the Lamport key 'Yi'.
-    print("Check one time signature of the received message: " + M_receiver)
-    result = LamportSignature.verify(M_receiver, sig_receiver[0], LamportSignature.decatenate_key(sig_receiver[1]))
+    print("Check one time signature of the received message: " + str(M_receiver, 'utf-8', 'replace'))
+    result = LamportSignature.verify(M_receiver, sig_receiver[0], sig_receiver[1])
     print("One-time signature is: " + str(result))
 
     # If 'sig_prime' is a valid signature of 'M', the receiver computes the leaf corresponding to the Lamport key 'Yi'.
     if result:
-        mk_receiver = MerkleTree(n_leaves=N)
-        mk_receiver.add_node(sig_receiver[1], (0, pair), hashed=False)
-        mk_receiver.generate_tree()
+        leaf = MerkleTree.hash(sig_receiver[1])
 
-        # The nodes of the authentification path are computed.
-        for i, (level, index) in enumerate(mk_receiver.get_authentification_path(pair)):
-            mk_receiver.add_node(sig_receiver[2][i], (level, index), hashed=True)
-        mk_receiver.generate_tree()
-
-        # If the tree's root equals the public key 'pub' the signature is valid.
-        result = mk_receiver.get_root() == pub_receiver
+        # If the authentification path leads from the leaf to the public key 'pub' the signature is valid.
+        result = MerkleTree.verify_auth_path(leaf, pair, sig_receiver[2], pub_receiver)
         print("Merkle signature is: " + str(result))
 
 
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Append-only Merkle tree (transparency log) with inclusion and consistency proofs.
+  Created:  18/10/2026
+"""
+
+from hash_functions import get_hash_function
+from merkle_tree import MerkleTree
+
+
+def split(n):
+    """Largest power of two smaller than 'n' (n > 1), where a tree of 'n' leaves is split."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+class MerkleLog:
+    """Append-only Merkle tree of any number of leaves.
+
+    The tree of n leaves is the one of RFC 6962 without the leaf and node prefixes: its left
+    subtree is the complete tree of the largest power of two k < n leaves and its right
+    subtree the tree of the n - k others. It is the tree of MerkleTreeBuilder, and of
+    MerkleTree when n is a power of two.
+
+    Only the complete subtrees are stored, which never change once their last leaf is
+    appended: level L holds the roots of the n >> L complete subtrees of 2^L leaves, so
+    appending a leaf costs one hash on average and the tree of any former size is still
+    available for proofs.
+
+    Attributes:
+        levels (list): Contiguous complete subtree roots of each level, leaves first.
+        size (int): Number of leaves appended.
+        hash_function (HashFunction): Hash function of the leaves and of the internal nodes.
+
+    """
+
+    def __init__(self, hash_function=None):
+        """MerkleLog object constructor.
+
+        Args:
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+        """
+        self.hash_function = get_hash_function(hash_function)
+        self.levels = []
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, data, hashed=False):
+        """Append a leaf, hashing the subtrees it completes.
+
+        Args:
+            data (str/bytes-like/os.PathLike/file object/iterable): Leaf value, see HashFunction.hash_message().
+            hashed (boolean): 'data' already hashed or not.
+
+        Returns:
+            (int): Index of the leaf.
+
+        """
+        node_size = self.hash_function.digest_size
+        if not hashed:
+            node = self.hash_function.hash_message(data)
+        else:
+            node = bytes.fromhex(data) if type(data) is str else data
+            if len(node) != node_size:
+                raise ValueError("Wrong leaf hash size.")
+        digest = self.hash_function.digest
+        level = 0
+        while True:
+            if level == len(self.levels):
+                self.levels.append(bytearray())
+            nodes = self.levels[level]
+            nodes += node
+            if len(nodes) // node_size & 1:
+                break
+            node = digest(nodes[-2 * node_size:])
+            level += 1
+        self.size += 1
+        return self.size - 1
+
+    def extend(self, leaves, hashed=False):
+        """Append the leaves of an iterable, see append().
+
+        Args:
+            leaves (iterable): Leaf values.
+            hashed (boolean): 'leaves' already hashed or not.
+
+        """
+        for data in leaves:
+            self.append(data, hashed)
+
+    def get_node(self, level, index):
+        """Get the root of a complete subtree.
+
+        Args:
+            level (int): Level of the node, log2 of the number of leaves of the subtree.
+            index (int): Index of the node in its level.
+
+        Returns:
+            (bytes): Node hash.
+
+        """
+        node_size = self.hash_function.digest_size
+        if level < 0 or level >= len(self.levels) or not 0 <= index < self.size >> level:
+            raise KeyError((level, index))
+        return bytes(self.levels[level][index * node_size:(index + 1) * node_size])
+
+    def subtree_hash(self, start, end):
+        """Get the root of the tree of the leaves 'start' to 'end' - 1, with O(log n) hashes.
+
+        Args:
+            start (int): First leaf, a multiple of the largest power of two not above end - start.
+            end (int): Leaf after the last one, at most 'size'.
+
+        Returns:
+            (bytes): Root hash.
+
+        """
+        n = end - start
+        if n & (n - 1) == 0:
+            level = n.bit_length() - 1
+            return self.get_node(level, start >> level)
+        k = split(n)
+        return self.hash_function.digest(self.subtree_hash(start, start + k) + self.subtree_hash(start + k, end))
+
+    def get_root(self, size=None):
+        """Get the root of the tree.
+
+        Args:
+            size (int): Number of leaves of the tree, the current one if None.
+
+        Returns:
+            (bytearray): Root hash.
+
+        """
+        size = self.size if size is None else size
+        if not 0 < size <= self.size:
+            raise ValueError("Wrong tree size.")
+        if size == self.size:  # Fold the roots of the complete subtrees, as MerkleTreeBuilder does.
+            root = None
+            for level in range(size.bit_length()):
+                if size >> level & 1:
+                    node = self.get_node(level, (size >> level) - 1)
+                    root = node if root is None else self.hash_function.digest(node + root)
+            return bytearray(root)
+        return bytearray(self.subtree_hash(0, size))
+
+    def get_inclusion_proof(self, index, size=None):
+        """Authentification path of a leaf in the tree of 'size' leaves.
+
+        Args:
+            index (int): Leaf number (from 0 to size - 1).
+            size (int): Number of leaves of the tree, the current one if None.
+
+        Returns:
+            (list): Brother hashes from the leaf up to the root, see verify_inclusion().
+
+        """
+        size = self.size if size is None else size
+        if not 0 < size <= self.size or not 0 <= index < size:
+            raise ValueError("Wrong leaf index or tree size.")
+        path = []
+        start, end = 0, size
+        while end - start > 1:
+            k = split(end - start)
+            if index < start + k:
+                path.append(self.subtree_hash(start + k, end))
+                end = start + k
+            else:
+                path.append(self.subtree_hash(start, start + k))
+                start += k
+        return path[::-1]
+
+    def get_consistency_proof(self, old_size, new_size=None):
+        """Proof that the tree of 'old_size' leaves is a prefix of the tree of 'new_size' leaves.
+
+        Args:
+            old_size (int): Number of leaves of the old tree.
+            new_size (int): Number of leaves of the new tree, the current one if None.
+
+        Returns:
+            (list): Node hashes, see verify_consistency().
+
+        """
+        new_size = self.size if new_size is None else new_size
+        if not 0 < old_size <= new_size <= self.size:
+            raise ValueError("Wrong tree sizes.")
+        proof = []
+        start, end, complete = 0, new_size, True
+        m = old_size
+        while m != end - start:
+            k = split(end - start)
+            if m <= k:
+                proof.append(self.subtree_hash(start + k, end))
+                end = start + k
+            else:
+                proof.append(self.subtree_hash(start, start + k))
+                start += k
+                m -= k
+                complete = False
+        if not complete:
+            proof.append(self.subtree_hash(start, end))
+        return proof[::-1]
+
+    @staticmethod
+    def verify_inclusion(leaf_hash, index, size, path, root, hash_function=None):
+        """Check the authentification path of a leaf against the root of a tree of 'size' leaves.
+
+        When 'size' is a power of two this is MerkleTree.verify_auth_path().
+
+        Args:
+            leaf_hash (bytes-like): Hash of the leaf.
+            index (int): Leaf number (from 0 to size - 1).
+            size (int): Number of leaves of the tree.
+            path (list): Brother hashes, see get_inclusion_proof().
+            root (bytes-like): Root hash.
+            hash_function (None/str/HashFunction): Hash function of the tree, sha256 if None.
+
+        Returns:
+            (boolean): True if the path leads from the leaf to the root otherwise False.
+
+        """
+        if not 0 <= index < size:
+            return False
+        if size & (size - 1) == 0:
+            return len(path) == size.bit_length() - 1 and MerkleTree.verify_auth_path(
+                leaf_hash, index, path, root, hash_function)
+        digest = get_hash_function(hash_function).digest
+        fn, sn = index, size - 1
+        node = bytes(leaf_hash)
+        for brother in path:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                node = digest(bytes(brother) + node)
+                while not fn & 1 and fn:  # Skip the levels where the node has no brother.
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                node = digest(node + bytes(brother))
+            fn >>= 1
+            sn >>= 1
+        return sn == 0 and node == root
+
+    @staticmethod
+    def verify_consistency(old_size, new_size, old_root, new_root, proof, hash_function=None):
+        """Check that the tree of 'old_root' is a prefix of the tree of 'new_root'.
+
+        Args:
+            old_size (int): Number of leaves of the old tree.
+            new_size (int): Number of leaves of the new tree.
+            old_root (bytes-like): Root hash of the old tree.
+            new_root (bytes-like): Root hash of the new tree.
+            proof (list): Node hashes, see get_consistency_proof().
+            hash_function (None/str/HashFunction): Hash function of the trees, sha256 if None.
+
+        Returns:
+            (boolean): True if the new tree extends the old one otherwise False.
+
+        """
+        if not 0 < old_size <= new_size:
+            return False
+        if old_size == new_size:
+            return not proof and old_root == new_root
+        digest = get_hash_function(hash_function).digest
+        proof = [bytes(i) for i in proof]
+        if old_size & (old_size - 1) == 0:  # The old root is a node of the new tree.
+            proof.insert(0, bytes(old_root))
+        if not proof:
+            return False
+        fn, sn = old_size - 1, new_size - 1
+        while fn & 1:
+            fn >>= 1
+            sn >>= 1
+        old_node = new_node = proof[0]
+        for node in proof[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                old_node = digest(node + old_node)
+                new_node = digest(node + new_node)
+                while not fn & 1 and fn:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                new_node = digest(new_node + node)
+            fn >>= 1
+            sn >>= 1
+        return sn == 0 and old_node == old_root and new_node == new_root
+
+
+def main():
+    log = MerkleLog()
+    log.extend(str(i) for i in range(1000))
+    old_root = log.get_root()
+    log.extend(str(i) for i in range(1000, 1500))
+    proof = log.get_consistency_proof(1000)
+    print("Consistency 1000 -> 1500:", MerkleLog.verify_consistency(1000, 1500, old_root, log.get_root(), proof))
+    path = log.get_inclusion_proof(1234)
+    print("Inclusion of leaf 1234:", MerkleLog.verify_inclusion(log.get_node(0, 1234), 1234, 1500, path, log.get_root()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Stateful Merkle signature scheme with log space authentification path traversal.
+  Created:  18/10/2026
+"""
+
+import hmac
+import struct
+import threading
+from os import urandom
+from hash_functions import SHA256, get_hash_function
+from lamport import LamportSignature
+from merkle_tree import MerkleTree
+
+
+MESSAGE_PREFIX = b"\x00"  # Prefix of the messages signed by the bottom layer of a hypertree.
+ROOT_PREFIX = b"\x01"  # Prefix of the subtree roots signed by the upper layers of a hypertree.
+
+
+class TreeHash:
+    """Incremental computation of one node of a Merkle tree, one leaf at a time.
+
+    Attributes:
+        height (int): Level of the node to compute.
+        next_leaf (int): Index of the next leaf to compute.
+        stack (list): (level, hash) of the nodes computed but not yet combined.
+        node (None/bytes): Hash of the node once computed.
+        hash_function (HashFunction): Hash function of the internal nodes.
+
+    """
+
+    def __init__(self, height, start_leaf=0, node=None, hash_function=SHA256):
+        """TreeHash object constructor.
+
+        Args:
+            height (int): Level of the node to compute.
+            start_leaf (int): Index of the first leaf below the node.
+            node (bytes): Hash of the node if already known.
+            hash_function (HashFunction): Hash function of the internal nodes.
+
+        """
+        self.height = height
+        self.next_leaf = start_leaf
+        self.stack = []
+        self.node = node
+        self.hash_function = hash_function
+
+    def low(self):
+        """Level of the lowest node on the stack, the height if empty, None once completed."""
+        if self.node is not None:
+            return None
+        return self.stack[-1][0] if self.stack else self.height
+
+    def update(self, leaf):
+        """Compute the next leaf and combine the stack.
+
+        Args:
+            leaf (function): Leaf index -> leaf hash.
+
+        """
+        level, node = 0, leaf(self.next_leaf)
+        self.next_leaf += 1
+        while self.stack and self.stack[-1][0] == level:
+            node = self.hash_function.digest(self.stack.pop()[1] + node)
+            level += 1
+        if level == self.height:
+            self.node = node
+        else:
+            self.stack.append((level, node))
+
+
+class MerkleSigner:
+    """Merkle signature scheme signer.
+
+    The one-time keys are Lamport keys derived from a master seed, so only the seed, the
+    index of the next leaf and O(height) nodes are kept. The authentification path of each
+    leaf is produced from the previous one with Szydlo's traversal algorithm: a TreeHash per
+    level prepares the next node of the path needed at that level, and 'height' leaf
+    computations per signature are spent on the one with the lowest stack. The signer is
+    restarted from its seed and the index of its next leaf, never from the seed alone.
+
+    Attributes:
+        height (int): Height of the tree, 2^height signatures are available.
+        seed (bytes): Master seed of the one-time keys.
+        hash_function (HashFunction): Hash function of the one-time keys and of the tree.
+        root (bytes): Root of the tree, public key of the scheme.
+        index (int): Index of the next leaf to use.
+        auth (list): Authentification path of the leaf 'index'.
+        treehash (list): TreeHash preparing the next node of each level of the path, None once
+            no other node of the level is needed.
+
+    """
+
+    def __init__(self, height, seed=None, hash_function=None, index=0):
+        """MerkleSigner object constructor, computes the root with one pass over the leaves.
+
+        Args:
+            height (int): Height of the tree.
+            seed (bytes-like): Master seed of the one-time keys, random if None.
+            hash_function (None/str/HashFunction): Hash function with 256-bit digests,
+                see hash_functions.get_hash_function().
+            index (int): Index of the next leaf to use, to restart a signer whose keys
+                up to 'index' - 1 are used.
+
+        """
+        if not 0 <= index <= 2 ** height:
+            raise ValueError("Wrong leaf index.")
+        self.height = height
+        self.seed = urandom(32) if seed is None else bytes(seed)
+        self.hash_function = LamportSignature.check_hash_function(hash_function)
+        self.index = index
+        self.lock = threading.Lock()
+        self.auth = [None] * height
+        self.treehash = [None] * height
+        stack = []
+        for i in range(2 ** height):
+            level, node = 0, self.leaf(i)
+            while True:
+                if level < height:  # Path of the leaf 'index' and next node of each level.
+                    block = index >> level
+                    if i >> level == block ^ 1:
+                        self.auth[level] = node
+                    elif i >> level == (block + 1) ^ 1 and block + 1 < 2 ** (height - level):
+                        self.treehash[level] = TreeHash(level, node=node, hash_function=self.hash_function)
+                if not stack or stack[-1][0] != level:
+                    break
+                node = self.hash_function.digest(stack.pop()[1] + node)
+                level += 1
+            stack.append((level, node))
+        self.root = stack[0][1]
+
+    def key(self, index):
+        """One-time key of the leaf 'index'.
+
+        Args:
+            index (int): Leaf number.
+
+        Returns:
+            (LamportSignature): Key pair derived from the seed.
+
+        """
+        return LamportSignature(seed=self.seed, index=index, hash_function=self.hash_function)
+
+    def leaf(self, index):
+        """Hash of the leaf 'index', the hash of its concatenated public key.
+
+        Args:
+            index (int): Leaf number.
+
+        Returns:
+            (bytes): Leaf hash.
+
+        """
+        return self.hash_function.digest(self.key(index).get_key('public', concatenate=True))
+
+    def remaining(self):
+        """Number of signatures left."""
+        return 2 ** self.height - self.index
+
+    def sign(self, msg):
+        """Sign a message with the next one-time key.
+
+        Args:
+            msg (str): Message to sign.
+
+        Returns:
+            (tuple): Leaf index, signature [sig_prime, Yi, auth(0), ..., auth(n-1)] as in main.py.
+
+        """
+        with self.lock:
+            if self.index >= 2 ** self.height:
+                raise ValueError("No one-time key left.")
+            index = self.index
+            auth = list(self.auth)
+            self.index += 1
+            if self.index < 2 ** self.height:
+                self.next_auth(index)
+        key = self.key(index)
+        return index, [key.sign(msg), key.get_key('public', concatenate=True), auth]
+
+    def next_auth(self, index):
+        """Move the authentification path from the leaf 'index' to the next one.
+
+        Args:
+            index (int): Leaf number whose path has just been used.
+
+        """
+        for h in range(self.height):
+            if (index + 1) % 2 ** h:
+                continue
+            treehash = self.treehash[h]
+            while treehash.node is None:  # Only happens if the schedule is late.
+                treehash.update(self.leaf)
+            self.auth[h] = treehash.node
+            start = (index + 1 + 2 ** h) ^ 2 ** h
+            if start < 2 ** self.height:
+                self.treehash[h] = TreeHash(h, start, hash_function=self.hash_function)
+            else:
+                self.treehash[h] = None
+        for _ in range(self.height):
+            pending = [i for i in self.treehash if i is not None and i.low() is not None]
+            if not pending:
+                break
+            min(pending, key=TreeHash.low).update(self.leaf)
+
+    @staticmethod
+    def verify(msg, index, signature, root, hash_function=None):
+        """Verify a Merkle signature.
+
+        Args:
+            msg (str): Message to check.
+            index (int): Leaf index of the signature.
+            signature (list): [sig_prime, Yi, auth(0), ..., auth(n-1)].
+            root (bytes-like): Public key of the scheme.
+            hash_function (None/str/HashFunction): Hash function of the scheme, sha256 if None.
+
+        Returns:
+            (boolean): True if signature of the message is right otherwise False.
+
+        """
+        hash_function = get_hash_function(hash_function)
+        sig_prime, public_key, auth = signature
+        if not LamportSignature.verify(msg, sig_prime, public_key, hash_function):
+            return False
+        return MerkleTree.verify_auth_path(hash_function(public_key), index, auth, root, hash_function)
+
+
+class HypertreeSigner:
+    """Multi-level Merkle signature scheme signer.
+
+    The tree of height layers×subtree_height is split in layers of subtrees of height
+    'subtree_height'. The subtrees of the bottom layer sign the messages, and the root of
+    each subtree is signed by a leaf of the current subtree of the layer above. Messages and
+    subtree roots are signed with distinct prefixes, so a root signature is never a valid
+    message signature. Only the current subtree of each layer exists, the next one is
+    generated when the current one is exhausted, so key generation costs
+    layers×2^subtree_height leaves whatever the number of signatures.
+
+    Attributes:
+        layers (int): Number of layers.
+        subtree_height (int): Height of the subtrees.
+        seed (bytes): Master seed of the subtrees.
+        hash_function (HashFunction): Hash function of the subtrees.
+        tree_index (list): Index of the current subtree of each layer.
+        signers (list): MerkleSigner of the current subtree of each layer, bottom first.
+        root_signatures (list): (index, signature) of the root of each current subtree by the
+            layer above, bottom first.
+        root (bytes): Root of the top subtree, public key of the scheme.
+
+    """
+
+    def __init__(self, layers, subtree_height, seed=None, hash_function=None, index=0):
+        """HypertreeSigner object constructor.
+
+        Args:
+            layers (int): Number of layers.
+            subtree_height (int): Height of the subtrees.
+            seed (bytes-like): Master seed, random if None.
+            hash_function (None/str/HashFunction): Hash function with 256-bit digests,
+                see hash_functions.get_hash_function().
+            index (int): Number of messages already signed with 'seed', see the 'index'
+                property, to restart a signer without reusing its one-time keys.
+
+        """
+        if index < 0:
+            raise ValueError("Wrong signature index.")
+        self.layers = layers
+        self.subtree_height = subtree_height
+        self.seed = urandom(32) if seed is None else bytes(seed)
+        self.hash_function = LamportSignature.check_hash_function(hash_function)
+        self.lock = threading.Lock()
+        self.tree_index = []
+        self.signers = []
+        self.root_signatures = []
+        count = index  # Signatures made by the layer, the current subtree is only replaced on the next one.
+        for layer in range(layers):
+            tree_index = (count - 1) >> subtree_height if count else 0
+            leaf = count - (tree_index << subtree_height)
+            if layer == layers - 1 and tree_index:
+                raise ValueError("No one-time key left.")
+            self.tree_index.append(tree_index)
+            if layer == 0:
+                self.signers.append(self.subtree(layer, tree_index, leaf))
+            else:  # Sign the root of the subtree below again with the leaf that signed it.
+                self.signers.append(self.subtree(layer, tree_index, leaf - 1))
+                self.root_signatures.append(self.signers[layer].sign([ROOT_PREFIX, self.signers[layer - 1].root]))
+            count = tree_index + 1
+        self.root = self.signers[-1].root
+
+    @property
+    def index(self):
+        """(int): Number of messages signed, the 'index' to restart the signer from."""
+        return (self.tree_index[0] << self.subtree_height) + self.signers[0].index
+
+    def subtree(self, layer, tree_index, index=0):
+        """Generate a subtree.
+
+        Args:
+            layer (int): Layer of the subtree, 0 for the bottom one.
+            tree_index (int): Index of the subtree in its layer.
+            index (int): Index of the next leaf of the subtree to use.
+
+        Returns:
+            (MerkleSigner): Signer of the subtree, with a seed derived from the master seed.
+
+        """
+        seed = hmac.digest(self.seed, struct.pack('>BQ', layer, tree_index), 'sha256')
+        return MerkleSigner(self.subtree_height, seed, self.hash_function, index)
+
+    def next_subtree(self, layer):
+        """Replace the exhausted subtree of 'layer' with the next one.
+
+        Args:
+            layer (int): Layer of the subtree.
+
+        """
+        if layer == self.layers - 1:
+            raise ValueError("No one-time key left.")
+        if self.signers[layer + 1].remaining() == 0:
+            self.next_subtree(layer + 1)
+        self.tree_index[layer] += 1
+        self.signers[layer] = self.subtree(layer, self.tree_index[layer])
+        self.root_signatures[layer] = self.signers[layer + 1].sign([ROOT_PREFIX, self.signers[layer].root])
+
+    def sign(self, msg):
+        """Sign a message with the next one-time key.
+
+        Args:
+            msg (str/bytes-like): Message to sign.
+
+        Returns:
+            (list): (index, signature) of each layer, bottom first, see MerkleSigner.sign().
+
+        """
+        with self.lock:
+            if self.signers[0].remaining() == 0:
+                self.next_subtree(0)
+            return [self.signers[0].sign([MESSAGE_PREFIX, msg])] + self.root_signatures
+
+    @staticmethod
+    def verify(msg, signature, root, layers, hash_function=None):
+        """Verify a multi-level Merkle signature.
+
+        Args:
+            msg (str/bytes-like): Message to check.
+            signature (list): (index, signature) of each layer, see sign().
+            root (bytes-like): Public key of the scheme.
+            layers (int): Number of layers of the scheme.
+            hash_function (None/str/HashFunction): Hash function of the scheme, sha256 if None.
+
+        Returns:
+            (boolean): True if signature of the message is right otherwise False.
+
+        """
+        if len(signature) != layers:
+            return False
+        hash_function = get_hash_function(hash_function)
+        signed = [MESSAGE_PREFIX, msg]
+        for index, (sig_prime, public_key, auth) in signature:
+            if not LamportSignature.verify(signed, sig_prime, public_key, hash_function):
+                return False
+            node = MerkleTree.compute_root(hash_function(public_key), index, auth, hash_function)
+            if node is None:
+                return False
+            signed = [ROOT_PREFIX, node]
+        return node == root
+
+
+def main():
+    signer = MerkleSigner(height=4)
+    for i in range(3):
+        index, signature = signer.sign("test {}".format(i))
+        print(index, MerkleSigner.verify("test {}".format(i), index, signature, signer.root))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Merkle tree synchronization: find the leaves two replicas disagree on.
+  Created:  18/10/2026
+"""
+
+import socket
+import struct
+import threading
+from hash_functions import get_hash_function
+from merkle_tree import MerkleTree
+from socket_client_server import send_message, receive_message, MAX_MESSAGE_SIZE
+
+
+REQUEST_INFO = 0  # Request for the shape of the tree, answered with INFO.
+REQUEST_NODES = 1  # Request for nodes of a level, answered with one NODE_FLAG and hash per node.
+REQUEST = struct.Struct('>BBI')  # Request type, level, number of node indexes that follow.
+NODE_INDEX = struct.Struct('>Q')
+INFO = struct.Struct('>QB15s')  # Number of leaves, digest size, hash function name.
+MAX_INDEXES = 2 ** 16  # Node indexes per request.
+
+
+def serve_sync(sock, tree, max_size=MAX_MESSAGE_SIZE):
+    """Answer the requests of a RemoteTree until the connection is closed.
+
+    Args:
+        sock (socket): Connected socket.
+        tree (MerkleTree): Generated tree served.
+        max_size (int): Largest request accepted.
+
+    Returns:
+        (int): Number of requests answered.
+
+    """
+    answered = 0
+    node_size = tree.hash_function.digest_size
+    absent = b"\0" * (1 + node_size)
+    for request in iter(lambda: receive_message(sock, max_size), None):
+        if len(request) < REQUEST.size:
+            raise ValueError("Wrong request size.")
+        request_type, level, count = REQUEST.unpack_from(request)
+        if request_type == REQUEST_INFO:
+            send_message(sock, INFO.pack(tree.n_leaves, node_size, tree.hash_function.name.encode('ascii')))
+        elif request_type == REQUEST_NODES:
+            if len(request) != REQUEST.size + count * NODE_INDEX.size:
+                raise ValueError("Wrong request size.")
+            indexes = struct.unpack_from('>{}Q'.format(count), request, REQUEST.size)
+            try:
+                nodes = tree.get_nodes(level, indexes)
+            except KeyError:
+                raise ValueError("Wrong node position.")
+            if any(node is not None and len(node) != node_size for node in nodes):
+                raise ValueError("Only nodes of {} bytes can be synchronized.".format(node_size))
+            send_message(sock, b"".join([absent if node is None else b"\1" + node for node in nodes]))
+        else:
+            raise ValueError("Unknown request type.")
+        answered += 1
+    return answered
+
+
+class RemoteTree:
+    """Nodes of a tree served by serve_sync() on the other end of a socket.
+
+    It has the interface MerkleTree.diff() expects from the other tree, so the differing
+    leaves of a local tree and of a remote one are found with tree.diff(RemoteTree(sock)).
+
+    Attributes:
+        sock (socket): Connected socket.
+        n_leaves (int): Number of leaves in the remote tree.
+        hash_function (HashFunction): Hash function of the remote tree.
+        requests (int): Number of requests sent.
+        fetched (int): Number of nodes received.
+
+    """
+
+    def __init__(self, sock):
+        """RemoteTree object constructor, asks for the shape of the remote tree.
+
+        Args:
+            sock (socket): Connected socket.
+
+        """
+        self.sock = sock
+        self.requests = 0
+        self.fetched = 0
+        n_leaves, digest_size, name = INFO.unpack(self.request(REQUEST.pack(REQUEST_INFO, 0, 0)))
+        self.n_leaves = n_leaves
+        self.hash_function = get_hash_function(name.rstrip(b"\0").decode('ascii'), digest_size)
+
+    def request(self, data):
+        """Send a request and wait for its response.
+
+        Args:
+            data (bytes-like): Request.
+
+        Returns:
+            (bytearray): Response.
+
+        """
+        send_message(self.sock, data)
+        self.requests += 1
+        response = receive_message(self.sock)
+        if response is None:
+            raise ConnectionError("Connection closed by the server.")
+        return response
+
+    def get_nodes(self, level, indexes):
+        """Get several nodes of a level of the remote tree, see MerkleTree.get_nodes().
+
+        Args:
+            level (int): Level of the nodes.
+            indexes (iterable): Node indexes in the level.
+
+        Returns:
+            (list): Node hashes, None for unknown nodes.
+
+        """
+        indexes = list(indexes)
+        entry_size = 1 + self.hash_function.digest_size
+        nodes = []
+        for start in range(0, len(indexes), MAX_INDEXES):
+            batch = indexes[start:start + MAX_INDEXES]
+            response = self.request(REQUEST.pack(REQUEST_NODES, level, len(batch)) +
+                                    struct.pack('>{}Q'.format(len(batch)), *batch))
+            if len(response) != len(batch) * entry_size:
+                raise ValueError("Wrong response size.")
+            nodes.extend(bytes(response[i + 1:i + entry_size]) if response[i] else None
+                         for i in range(0, len(response), entry_size))
+        self.fetched += len(indexes)
+        return nodes
+
+
+def main():
+    local, remote = MerkleTree(n_leaves=1024), MerkleTree(n_leaves=1024)
+    local.add_leaves(str(i) for i in range(1024))
+    remote.add_leaves(str(i) for i in range(1024))
+    for index in (3, 500, 501, 1000):
+        remote.add_node("changed", (0, index))
+    local.generate_tree()
+    remote.generate_tree()
+
+    server_sock, client_sock = socket.socketpair()
+    server = threading.Thread(target=serve_sync, args=(server_sock, remote))
+    server.start()
+    remote_tree = RemoteTree(client_sock)
+    print("Differing leaves:", local.diff(remote_tree))
+    print("{} requests, {} nodes fetched".format(remote_tree.requests, remote_tree.fetched))
+    client_sock.close()
+    server.join()
+    server_sock.close()
+
+
+if __name__ == "__main__":
+    main()
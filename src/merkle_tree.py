@@ -5,38 +5,280 @@
   Created:  19/04/2017
 """
 
-import hashlib
+import heapq
+import os
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from mmap import mmap as memory_map, ACCESS_COPY
 from math import log2, floor
+from hash_functions import SHA256, chunk_hashes, get_hash_function
+
+
+NODE_SIZE = 32  # Size in bytes of a node hash with the default hash function (sha256 digest).
+FILE_MAGIC = b"MERKLE01"
+FILE_HEADER = struct.Struct('<8sQB15s')  # Magic, number of leaves, digest size, hash function name.
+
+
+def hash_subtree(leaves, hash_function=SHA256):
+    """Hash a complete subtree from its contiguous leaf hashes.
+
+    Args:
+        leaves (bytes-like): Leaf hashes, 'hash_function.digest_size' bytes each, a power of two of them.
+        hash_function (HashFunction): Hash function of the tree.
+
+    Returns:
+        (list): Contiguous node hashes of each level above the leaves, up to the subtree root.
+
+    """
+    levels = []
+    level = memoryview(leaves)
+    node_size = hash_function.digest_size
+    step = 2 * node_size
+    digest = hash_function.digest
+    while len(level) > node_size:
+        parents = b"".join([digest(level[j:j + step]) for j in range(0, len(level), step)])
+        levels.append(parents)
+        level = memoryview(parents)
+    return levels
+
+
+class NodeStorage:
+    """Heap-ordered storage of the nodes of a Merkle tree in one contiguous buffer.
+
+    Node (level, index) is stored at heap position (n_leaves >> level) + index: the root
+    is at position 1 and the children of position i are at 2i and 2i + 1, so two brothers
+    are always contiguous in the buffer.
+
+    Attributes:
+        n_leaves (int): Number of leaves in the tree (at level 0).
+        hash_function (HashFunction): Hash function combining two children.
+        node_size (int): Size in bytes of a node hash, the digest size of 'hash_function'.
+        buffer (bytearray): Node hashes, node_size bytes per heap position.
+        present (bytearray): Presence bitmap, one bit per heap position (0 for unknown nodes).
+        extra (dict): Nodes whose value is not node_size bytes long, keyed by heap position.
+
+    """
+
+    def __init__(self, n_leaves, buffer=None, present=None, hash_function=None):
+        """NodeStorage object constructor.
+
+        Args:
+            n_leaves (int): Number of leaves in the tree.
+            buffer (bytes-like): Preallocated writable node buffer, 2×n_leaves×node_size bytes.
+            present (bytes-like): Preallocated writable presence bitmap, (2×n_leaves + 7) // 8 bytes.
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+        """
+        self.n_leaves = n_leaves
+        self.hash_function = get_hash_function(hash_function)
+        self.node_size = self.hash_function.digest_size
+        self.buffer = bytearray(2 * n_leaves * self.node_size) if buffer is None else buffer
+        self.view = memoryview(self.buffer)
+        self.readonly_view = self.view.toreadonly()
+        self.present = bytearray(self.bitmap_size(n_leaves)) if present is None else present
+        self.extra = {}
+
+    @staticmethod
+    def bitmap_size(n_leaves):
+        """Size in bytes of the presence bitmap of a tree with 'n_leaves' leaves."""
+        return (2 * n_leaves + 7) // 8
+
+    def heap_index(self, position):
+        """Get the heap position of the node at 'position'.
+
+        Args:
+            position (tuple): Position in the tree (level, index).
+
+        Returns:
+            (int): Heap position.
+
+        """
+        level, index = position
+        if level < 0:
+            raise KeyError(position)
+        width = self.n_leaves >> level
+        if width == 0 or not 0 <= index < width:
+            raise KeyError(position)
+        return width + index
+
+    def position(self, i):
+        """Get the (level, index) position of the heap position 'i'.
+
+        Args:
+            i (int): Heap position.
+
+        Returns:
+            (tuple): Position in the tree (level, index).
+
+        """
+        level = self.n_leaves.bit_length() - i.bit_length()
+        return level, i - (self.n_leaves >> level)
+
+    def is_present(self, i):
+        """Check whether the node at heap position 'i' is known."""
+        return self.present[i >> 3] >> (i & 7) & 1
+
+    def get(self, i):
+        """Get the node at heap position 'i'.
+
+        Returns:
+            (None/memoryview): Read-only view on the node hash, None if the node is unknown.
+
+        """
+        if not self.present[i >> 3] >> (i & 7) & 1:
+            return None
+        if i in self.extra:
+            return self.extra[i]
+        return self.readonly_view[i * self.node_size:(i + 1) * self.node_size]
+
+    def set(self, i, value):
+        """Set the node at heap position 'i'.
+
+        Args:
+            i (int): Heap position.
+            value (None/bytes-like): Node hash, None for an unknown node.
+
+        """
+        if value is None:
+            self.present[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+            self.extra.pop(i, None)
+            return
+        if len(value) == self.node_size:
+            self.view[i * self.node_size:(i + 1) * self.node_size] = value
+            self.extra.pop(i, None)
+        else:
+            self.extra[i] = bytearray(value)
+        self.present[i >> 3] |= 1 << (i & 7)
+
+    def set_range(self, i, data):
+        """Set the contiguous nodes starting at heap position 'i'.
+
+        Args:
+            i (int): Heap position of the first node.
+            data (bytes-like): Node hashes, node_size bytes each.
+
+        """
+        count = len(data) // self.node_size
+        self.view[i * self.node_size:(i + count) * self.node_size] = data
+        for j in [j for j in self.extra if i <= j < i + count]:
+            del self.extra[j]
+        end = i + count
+        while i < end and i & 7:
+            self.present[i >> 3] |= 1 << (i & 7)
+            i += 1
+        full = (end - i) >> 3
+        self.present[i >> 3:(i >> 3) + full] = b"\xff" * full
+        i += full << 3
+        while i < end:
+            self.present[i >> 3] |= 1 << (i & 7)
+            i += 1
+
+    def is_range_complete(self, i, count):
+        """Check whether the 'count' contiguous nodes from heap position 'i' are all known and node_size long.
+
+        Args:
+            i (int): Heap position of the first node.
+            count (int): Number of nodes.
+
+        Returns:
+            (boolean): True if every node of the range is stored in the buffer.
+
+        """
+        if any(i <= j < i + count for j in self.extra):
+            return False
+        if i & 7 == 0 and count & 7 == 0:
+            return self.present[i >> 3:(i + count) >> 3] == b"\xff" * (count >> 3)
+        return all(self.is_present(j) for j in range(i, i + count))
+
+    def hash_children(self, i):
+        """Set the node at heap position 'i' to the hash of its two children if both are known.
+
+        Args:
+            i (int): Heap position of an internal node.
+
+        Returns:
+            (boolean): True if the node value has changed.
+
+        """
+        left = 2 * i
+        if not (self.is_present(left) and self.is_present(left + 1)):
+            return False
+        if left in self.extra or left + 1 in self.extra:
+            data = bytes(self.get(left)) + bytes(self.get(left + 1))
+        else:
+            data = self.view[left * self.node_size:(left + 2) * self.node_size]
+        digest = self.hash_function.digest(data)
+        if self.get(i) == digest:
+            return False
+        self.set(i, digest)
+        return True
+
+    def __getitem__(self, position):
+        return self.get(self.heap_index(position))
+
+    def __setitem__(self, position, value):
+        self.set(self.heap_index(position), value)
+
+    def __contains__(self, position):
+        try:
+            return bool(self.is_present(self.heap_index(position)))
+        except KeyError:
+            return False
+
+    def __len__(self):
+        return 2 * self.n_leaves - 1
+
+    def items(self):
+        """Iterate over the nodes, from the leaves to the root.
+
+        Yields:
+            (tuple): ((level, index), node hash or None).
+
+        """
+        for level in range(self.n_leaves.bit_length()):
+            width = self.n_leaves >> level
+            for index in range(width):
+                yield (level, index), self.get(width + index)
 
 
 class MerkleTree:
     """MerkleTree class.
 
     Attributes:
-        tree (dict): Merkle tree.
+        tree (NodeStorage): Merkle tree, indexed by (level, index).
+        hash_function (HashFunction): Hash function of the leaves and of the internal nodes.
         n_levels (int): Number of levels in the tree.
         n_leaves (int): Number of leaves in the tree (at level 0).
+        dirty (set): Heap positions of the internal nodes to re-hash at the next generate_tree().
         
     """
 
-    def __init__(self, n_leaves):
+    def __init__(self, n_leaves, storage=None, hash_function=None):
         """MerkleTree object constructor.
         
         Args:
             n_leaves (int): Number of leaves in the tree.
+            storage (NodeStorage): Existing node storage of the tree.
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function(),
+                ignored if 'storage' is given.
             
         """
         if floor(log2(n_leaves)) != log2(n_leaves):
             raise ValueError("Wrong number of leaves.")
-        self.tree = {}
-        self.n_levels = None
+        self.tree = NodeStorage(n_leaves, hash_function=hash_function) if storage is None else storage
+        self.hash_function = self.tree.hash_function
+        self.n_levels = int(log2(n_leaves)) + 1
         self.n_leaves = n_leaves
+        self.dirty = set()
 
     def add_node(self, data, position, hashed=False):
         """Add a node to the tree.
         
         Args:
-            data (str/None): Node value.
+            data (str/bytes-like/os.PathLike/file object/iterable/None): Node value, or if
+                'hashed' is False a file or chunks hashed incrementally, see HashFunction.hash_message().
             position (tuple): Position in the tree (level, index).
             hashed (boolean): 'data' already hashed or not.
             
@@ -44,43 +286,164 @@ class MerkleTree:
             If 'hashed' is True then 'data' will not be hashed.
 
         """
+        i = self.tree.heap_index(position)
         if data is None:
-            self.tree[position] = None
+            self.tree.set(i, None)
         elif hashed and type(data) is str:
-            self.tree[position] = bytearray.fromhex(data)
-        elif hashed and type(data) is bytearray:
-            self.tree[position] = data
+            self.tree.set(i, bytearray.fromhex(data))
+        elif hashed:
+            self.tree.set(i, data)
         else:
-            self.tree[position] = self.hash(data)
+            self.tree.set(i, self.hash_function.hash_message(data))
+        self.mark_dirty(i)
+
+    def add_leaves(self, leaves, start=0, hashed=False):
+        """Add contiguous leaves to the tree in one call.
+
+        Args:
+            leaves (iterable/bytes-like): Leaf values (str/bytes-like), or if 'hashed' is True
+                either leaf hashes or a single contiguous buffer of N×digest size bytes.
+            start (int): Index of the first leaf.
+            hashed (boolean): 'leaves' already hashed or not.
+
+        """
+        node_size = self.tree.node_size
+        if hashed and isinstance(leaves, (bytes, bytearray, memoryview)):
+            data = memoryview(leaves).cast('B')
+            if len(data) % node_size:
+                raise ValueError("Wrong leaves buffer size.")
+        elif hashed:
+            leaves = [bytes.fromhex(i) if type(i) is str else i for i in leaves]
+            if any(len(i) != node_size for i in leaves):
+                raise ValueError("Wrong leaf hash size.")
+            data = b"".join(leaves)
+        else:
+            digest = self.hash_function.digest
+            data = b"".join([digest(i.encode('utf-8') if type(i) is str else i) for i in leaves])
+        count = len(data) // node_size
+        if count == 0:
+            return
+        if start < 0 or start + count > self.n_leaves:
+            raise ValueError("Wrong leaves position.")
+        first = self.n_leaves + start
+        self.tree.set_range(first, data)
+        if self.n_leaves > 1:
+            self.dirty.update(range(first >> 1, ((first + count - 1) >> 1) + 1))
+
+    @classmethod
+    def from_file(cls, path, chunk_size=4096, hash_function=None, mmap=True, workers=1):
+        """Build the tree of a file whose leaves are the hashes of its fixed-size chunks.
+
+        The chunks are hashed in batches, see hash_functions.chunk_hashes(), so the file is
+        never held in memory. The leaves after the last chunk, up to the next power of two,
+        are the hash of an empty chunk.
+
+        Args:
+            path (str/bytes/os.PathLike): Path of the file.
+            chunk_size (int): Size in bytes of a chunk, the last one being possibly shorter.
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+            mmap (boolean): Map the file in memory instead of reading it.
+            workers (int): Number of processes hashing the tree, see generate_tree().
+
+        Returns:
+            (MerkleTree): Generated tree.
+
+        """
+        hash_function = get_hash_function(hash_function)
+        n_chunks = -(-os.path.getsize(path) // chunk_size)
+        mk = cls(1 << max(n_chunks - 1, 0).bit_length(), hash_function=hash_function)
+        start = 0
+        for hashes in chunk_hashes(path, chunk_size, hash_function, mmap):
+            mk.add_leaves(hashes, start, hashed=True)
+            start += len(hashes) // hash_function.digest_size
+        if start < mk.n_leaves:
+            mk.add_leaves(hash_function.digest(b"") * (mk.n_leaves - start), start, hashed=True)
+        mk.generate_tree(workers)
+        return mk
 
-    def generate_tree(self):
+    def mark_dirty(self, i):
+        """Schedule the re-hashing of the node at heap position 'i' and of its parent.
+
+        Args:
+            i (int): Heap position of the modified node.
+
+        """
+        if i < self.n_leaves:
+            self.dirty.add(i)
+        if i > 1:
+            self.dirty.add(i >> 1)
+
+    def generate_tree(self, workers=1):
         """Generate tree.
         
+        Only the ancestors of the nodes modified since the last call are re-hashed, each of
+        them once, and the propagation stops as soon as a node value does not change.
+        
+        Args:
+            workers (int): Number of processes used when the whole tree is rebuilt.
+        
         Note:
             Unknown node value is None.
             
         """
-        self.n_levels = int(log2(self.n_leaves)) + 1
-        for level in range(self.n_levels):
-            for pos in range(int(self.n_leaves / 2 ** level)):
-                if (level, pos) not in self.tree:
-                    self.tree[(level, pos)] = None
+        if len(self.dirty) >= self.n_leaves // 2:
+            self.rebuild_tree(workers)
+        else:
+            heap = [-i for i in self.dirty]  # Max-heap: deepest nodes first.
+            heapq.heapify(heap)
+            scheduled = set(self.dirty)
+            while heap:
+                i = -heapq.heappop(heap)
+                if self.tree.hash_children(i) and i > 1 and i >> 1 not in scheduled:
+                    scheduled.add(i >> 1)
+                    heapq.heappush(heap, -(i >> 1))
+        self.dirty.clear()
+
+    def rebuild_tree(self, workers=1):
+        """Rebuild the whole tree, hashing disjoint subtrees in a process pool if 'workers' > 1.
+
+        The leaves are split in a power of two of subtrees, at least 'workers' of them. Each
+        complete subtree is hashed level by level from its contiguous leaves, then the subtree
+        roots are joined serially into the top levels. The result is identical whatever the
+        number of workers.
+
+        Args:
+            workers (int): Number of processes, 1 to hash in the current process.
 
-        for level in range(1, self.n_levels):
-            for pos in range(int(self.n_leaves / 2 ** level)):
-                left_child = self.tree[(level - 1, 2 * pos)]
-                right_child = self.tree[(level - 1, 2 * pos + 1)]
-                if left_child is not None and right_child is not None:
-                    self.tree[(level, pos)] = self.hash(left_child + right_child)
+        """
+        n_subtrees = min(1 << (workers - 1).bit_length(), self.n_leaves)
+        width = self.n_leaves // n_subtrees  # Number of leaves per subtree.
+        complete = [s for s in range(n_subtrees)
+                    if width > 1 and self.tree.is_range_complete(self.n_leaves + s * width, width)]
+        node_size = self.tree.node_size
+        leaves = [self.tree.view[(self.n_leaves + s * width) * node_size:(self.n_leaves + (s + 1) * width) * node_size]
+                  for s in complete]
+        task = partial(hash_subtree, hash_function=self.hash_function)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(task, [bytes(i) for i in leaves]))
+        else:
+            results = map(task, leaves)
+        for s, levels in zip(complete, results):
+            for level, nodes in enumerate(levels, 1):
+                self.tree.set_range((self.n_leaves >> level) + s * (width >> level), nodes)
+        for s in set(range(n_subtrees)).difference(complete):  # Unknown nodes are propagated serially.
+            for level in range(1, width.bit_length()):
+                first = (self.n_leaves >> level) + s * (width >> level)
+                for i in range(first, first + (width >> level)):
+                    self.tree.hash_children(i)
+        for i in range(n_subtrees - 1, 0, -1):
+            self.tree.hash_children(i)
 
     def get_root(self):
         """Get root of the tree.
         
         Returns:
-            (bytes): Root hash.
+            (None/bytearray): Root hash.
         
         """
-        return self.tree[(self.n_levels - 1, 0)]
+        root = self.tree[(self.n_levels - 1, 0)]
+        return None if root is None else bytearray(root)
 
     def get_brother_node_hash(self, position):
         """Get the brother node of the node at 'position' (level, index).
@@ -88,7 +451,7 @@ class MerkleTree:
         Args:
             position (tuple): (level, index) of the current node.
         Returns:
-            (None/bytearray): Brother's node hash.
+            (None/memoryview): Brother's node hash.
         
         """
         try:
@@ -116,7 +479,7 @@ class MerkleTree:
             index (int): Leaf number (from 0 to n_leaves - 1)
         
         Returns:
-            (list) List which contains [auth(0), ..., auth(n-1)].
+            (list) List which contains [auth(0), ..., auth(n-1)], views on the tree storage.
         
         """
         return [self.tree[i] for i in self.get_authentification_path(index)]
@@ -137,20 +500,284 @@ class MerkleTree:
             index = int(floor(index / 2))  # Parent's node index.
         return auth_path
 
+    def get_multiproof(self, indexes):
+        """Positions of the smallest set of nodes proving several leaves at once.
+
+        Brothers that can be computed from the proven leaves are left out. The positions are
+        sorted by level then by index, which is the order verify_multiproof() consumes them.
+
+        Args:
+            indexes (iterable): Leaf numbers (from 0 to n_leaves - 1).
+
+        Returns:
+            (list) List which contains the (level, index) positions.
+
+        """
+        positions = []
+        known = sorted(set(indexes))
+        for level in range(self.n_levels - 1):
+            known_set = set(known)
+            positions.extend((level, index ^ 1) for index in known if index ^ 1 not in known_set)
+            known = sorted(set(index >> 1 for index in known))
+        return positions
+
+    def get_multiproof_hashes(self, indexes):
+        """Hashes of the nodes of the multi-proof of several leaves, see get_multiproof().
+
+        Args:
+            indexes (iterable): Leaf numbers (from 0 to n_leaves - 1).
+
+        Returns:
+            (list) List which contains the node hashes, views on the tree storage.
+
+        """
+        return [self.tree[i] for i in self.get_multiproof(indexes)]
+
+    def get_nodes(self, level, indexes):
+        """Get several nodes of a level.
+
+        Args:
+            level (int): Level of the nodes.
+            indexes (iterable): Node indexes in the level.
+
+        Returns:
+            (list): Node hashes (None for unknown nodes), views on the tree storage.
+
+        """
+        return [self.tree[level, index] for index in indexes]
+
+    def diff(self, other):
+        """Find the leaves that differ from another tree with the same shape.
+
+        The trees are walked top-down, one level at a time, and only the children of the
+        differing nodes are compared: k differing leaves cost O(k log n) node comparisons
+        and log2(n_leaves) + 1 calls to other.get_nodes().
+
+        Args:
+            other (MerkleTree/object): Other tree, or any object with 'n_leaves' and
+                'hash_function' attributes and a get_nodes() method, such as merkle_sync.RemoteTree.
+
+        Returns:
+            (list): Indexes of the differing leaves, sorted.
+
+        """
+        if self.dirty:
+            raise ValueError("Tree not generated.")
+        if other.n_leaves != self.n_leaves or other.hash_function != self.hash_function:
+            raise ValueError("Trees of different shapes or hash functions.")
+        indexes = [0]
+        for level in range(self.n_levels - 1, -1, -1):
+            local = self.get_nodes(level, indexes)
+            remote = other.get_nodes(level, indexes)
+            indexes = [index for index, a, b in zip(indexes, local, remote) if a != b]
+            if level and indexes:
+                indexes = [child for index in indexes for child in (2 * index, 2 * index + 1)]
+            if not indexes:
+                break
+        return indexes
+
+    @staticmethod
+    def verify_multiproof(leaves, proof, n_leaves, root, hash_function=None):
+        """Check a multi-proof of several leaves against a root.
+
+        Args:
+            leaves (dict): Leaf number -> leaf hash.
+            proof (list): Node hashes, see get_multiproof_hashes().
+            n_leaves (int): Number of leaves in the tree.
+            root (bytes-like): Root hash.
+            hash_function (None/str/HashFunction): Hash function of the tree, sha256 if None.
+
+        Returns:
+            (boolean): True if the leaves and the proof lead to the root otherwise False.
+
+        """
+        if not leaves or any(not 0 <= index < n_leaves for index in leaves):
+            return False
+        digest = get_hash_function(hash_function).digest
+        proof = iter(proof)
+        nodes = dict(leaves)
+        try:
+            for level in range(n_leaves.bit_length() - 1):
+                parents = {}
+                for index in sorted(nodes):
+                    if index >> 1 in parents:
+                        continue
+                    brother = nodes[index ^ 1] if index ^ 1 in nodes else next(proof)
+                    pair = (brother, nodes[index]) if index & 1 else (nodes[index], brother)
+                    parents[index >> 1] = digest(b"".join(pair))
+                nodes = parents
+        except (StopIteration, TypeError):  # Proof too short, or with unknown (None) nodes.
+            return False
+        if next(proof, False) is not False:
+            return False
+        return nodes[0] == root
+
+    @staticmethod
+    def compute_root(leaf_hash, index, path, hash_function=None):
+        """Compute the root a leaf leads to through an authentification path, with log2(n_leaves) hashes.
+
+        Args:
+            leaf_hash (bytes-like): Hash of the leaf.
+            index (int): Leaf number (from 0 to n_leaves - 1).
+            path (list): [auth(0), ..., auth(n-1)], see get_authentification_path_hashes().
+            hash_function (None/str/HashFunction): Hash function of the tree, sha256 if None.
+
+        Returns:
+            (None/bytes): Root hash, None if 'index' does not fit the path length.
+
+        """
+        if not 0 <= index < 1 << len(path):
+            return None
+        digest = get_hash_function(hash_function).digest
+        node = leaf_hash
+        for brother in path:
+            node = digest(b"".join((brother, node) if index & 1 else (node, brother)))
+            index >>= 1
+        return bytes(node)
+
+    @staticmethod
+    def verify_auth_path(leaf_hash, index, path, root, hash_function=None):
+        """Check an authentification path against a root with log2(n_leaves) hashes.
+
+        Args:
+            leaf_hash (bytes-like): Hash of the leaf.
+            index (int): Leaf number (from 0 to n_leaves - 1).
+            path (list): [auth(0), ..., auth(n-1)], see get_authentification_path_hashes().
+            root (bytes-like): Root hash.
+            hash_function (None/str/HashFunction): Hash function of the tree, sha256 if None.
+
+        Returns:
+            (boolean): True if the path leads from the leaf to the root otherwise False.
+
+        """
+        node = MerkleTree.compute_root(leaf_hash, index, path, hash_function)
+        return node is not None and node == root
+
+    @staticmethod
+    def verify_auth_paths(proofs, root, hash_function=None):
+        """Check many authentification paths of the same tree against its root.
+
+        The nodes of the paths already checked are remembered, so a path is accepted as soon
+        as it reaches an authenticated node and rejected as soon as it contradicts one. The
+        height of the tree is the length of the first path leading to the root.
+
+        Args:
+            proofs (iterable): (leaf_hash, index, path) tuples, see verify_auth_path().
+            root (bytes-like): Root hash.
+            hash_function (None/str/HashFunction): Hash function of the tree, sha256 if None.
+
+        Returns:
+            (list): True or False for each proof.
+
+        """
+        digest = get_hash_function(hash_function).digest
+        authenticated = {}  # (level, index) -> hash of the nodes of the valid paths.
+        n_levels = None
+        results = []
+        for leaf_hash, index, path in proofs:
+            if n_levels is not None and len(path) != n_levels - 1 or not 0 <= index < 1 << len(path):
+                results.append(False)
+                continue
+            nodes = {}
+            node = bytes(leaf_hash)
+            result = None
+            for level, brother in enumerate(path):
+                known = authenticated.get((level, index))
+                if known is not None:
+                    result = known == node
+                    break
+                nodes[(level, index)] = node
+                nodes[(level, index ^ 1)] = bytes(brother)
+                node = digest(b"".join((brother, node) if index & 1 else (node, brother)))
+                index >>= 1
+            if result is None:
+                result = node == root
+            if result:
+                authenticated.update(nodes)
+                n_levels = len(path) + 1
+            results.append(result)
+        return results
+
+    def save(self, path):
+        """Save the tree to a file.
+
+        The file is made of a header (FILE_HEADER: magic, n_leaves, hash function), the
+        presence bitmap padded to NODE_SIZE bytes, and the heap-ordered node buffer. It is
+        written to a temporary file then renamed, so the trees opened from 'path', this one
+        included, keep mapping the former content.
+
+        Args:
+            path (str): Path of the file.
+
+        """
+        if self.dirty:
+            raise ValueError("Tree not generated.")
+        if self.tree.extra:
+            raise ValueError("Only nodes of {} bytes can be saved.".format(self.tree.node_size))
+        bitmap_size = NodeStorage.bitmap_size(self.n_leaves)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with open(fd, 'wb') as f:
+                f.write(FILE_HEADER.pack(FILE_MAGIC, self.n_leaves, self.hash_function.digest_size,
+                                         self.hash_function.name.encode('ascii')))
+                f.write(self.tree.present)
+                f.write(bytes(-bitmap_size % NODE_SIZE))
+                f.write(self.tree.buffer)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @classmethod
+    def open(cls, path, mmap=True):
+        """Open a tree saved with save().
+
+        Args:
+            path (str): Path of the file.
+            mmap (boolean): Map the file in memory instead of reading it. The pages are shared
+                between the processes opening the same file; nodes modified afterwards are
+                private to the process and not written back.
+
+        Returns:
+            (MerkleTree): Tree.
+
+        """
+        with open(path, 'rb') as f:
+            header = f.read(FILE_HEADER.size)
+            if len(header) != FILE_HEADER.size:
+                raise ValueError("Not a Merkle tree file.")
+            magic, n_leaves, digest_size, name = FILE_HEADER.unpack(header)
+            if magic != FILE_MAGIC:
+                raise ValueError("Not a Merkle tree file.")
+            hash_function = get_hash_function(name.rstrip(b"\0").decode('ascii'), digest_size)
+            bitmap_size = NodeStorage.bitmap_size(n_leaves)
+            nodes_offset = FILE_HEADER.size + bitmap_size + (-bitmap_size % NODE_SIZE)
+            nodes_size = 2 * n_leaves * hash_function.digest_size
+            if mmap:
+                data = memoryview(memory_map(f.fileno(), 0, access=ACCESS_COPY))
+            else:
+                f.seek(0)
+                data = memoryview(bytearray(f.read()))
+        if len(data) != nodes_offset + nodes_size:
+            raise ValueError("Wrong Merkle tree file size.")
+        storage = NodeStorage(n_leaves,
+                              buffer=data[nodes_offset:nodes_offset + nodes_size],
+                              present=data[FILE_HEADER.size:FILE_HEADER.size + bitmap_size],
+                              hash_function=hash_function)
+        return cls(n_leaves, storage)
+
     @staticmethod
     def hash(data):
-        """Calculate sha256 hash of 'data'.
+        """Calculate sha256 hash of 'data', see 'hash_function' for the hash of a given tree.
         
         Args:
-            (str/bytearray): Data to hash
+            (str/bytes-like): Data to hash
 
         Returns:
             (bytearray): bytes of the hash.
 
         """
-        if type(data) is not bytearray:
-            data = data.encode('utf-8')
-        return bytearray(hashlib.sha256(data).digest())
+        return SHA256(data)
 
 
 def main():
@@ -166,10 +793,10 @@ def main():
     mk.generate_tree()
 
     for key, value in mk.tree.items():
-        print(key, value)
+        print(key, None if value is None else value.hex())
 
     print(mk.get_authentification_path(2))
-    print(mk.get_authentification_path_hashes(2))
+    print([i.hex() for i in mk.get_authentification_path_hashes(2)])
 
 
 if __name__ == "__main__":
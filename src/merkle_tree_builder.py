@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Streaming Merkle root computation.
+  Created:  18/10/2026
+"""
+
+from hash_functions import get_hash_function
+
+
+class MerkleTreeBuilder:
+    """Compute a Merkle root from a stream of leaves, keeping one pending hash per level.
+
+    A node without a brother is promoted unchanged to the next level, so any number of
+    leaves can be rooted. For a power of two of leaves the root is the one of a MerkleTree
+    with the same leaves.
+
+    Attributes:
+        pending (list): Root of the last complete subtree of each level, None if there is none.
+        n_leaves (int): Number of leaves added.
+        hash_function (HashFunction): Hash function of the leaves and of the internal nodes.
+
+    """
+
+    def __init__(self, hash_function=None):
+        """MerkleTreeBuilder object constructor.
+
+        Args:
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+        """
+        self.hash_function = get_hash_function(hash_function)
+        self.pending = []
+        self.n_leaves = 0
+
+    def add_leaf(self, data, hashed=False):
+        """Add the next leaf.
+
+        Args:
+            data (str/bytes-like): Leaf value.
+            hashed (boolean): 'data' already hashed or not.
+
+        """
+        digest = self.hash_function.digest
+        if hashed:
+            node = bytes.fromhex(data) if type(data) is str else bytes(data)
+        else:
+            node = digest(data.encode('utf-8') if type(data) is str else data)
+        level = 0
+        while level < len(self.pending) and self.pending[level] is not None:
+            node = digest(self.pending[level] + node)
+            self.pending[level] = None
+            level += 1
+        if level == len(self.pending):
+            self.pending.append(node)
+        else:
+            self.pending[level] = node
+        self.n_leaves += 1
+
+    def add_leaves(self, leaves, hashed=False):
+        """Add the leaves of an iterable, consumed lazily.
+
+        Args:
+            leaves (iterable): Leaf values (str/bytes-like).
+            hashed (boolean): 'leaves' already hashed or not.
+
+        """
+        for data in leaves:
+            self.add_leaf(data, hashed)
+
+    def get_root(self):
+        """Get the root of the leaves added so far.
+
+        Returns:
+            (bytearray): Root hash.
+
+        """
+        root = None
+        for node in self.pending:
+            if node is not None:
+                root = node if root is None else self.hash_function.digest(node + root)
+        if root is None:
+            raise ValueError("No leaf added.")
+        return bytearray(root)
+
+
+def streaming_root(leaves, hashed=False, hash_function=None):
+    """Compute the Merkle root of an iterable of leaves in O(log n) memory.
+
+    Args:
+        leaves (iterable): Leaf values (str/bytes-like).
+        hashed (boolean): 'leaves' already hashed or not.
+        hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+    Returns:
+        (bytearray): Root hash.
+
+    """
+    builder = MerkleTreeBuilder(hash_function)
+    builder.add_leaves(leaves, hashed)
+    return builder.get_root()
+
+
+def main():
+    print(streaming_root(str(i) for i in range(1000)).hex())
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,70 @@
 """
 
 import socket
+import struct
+
+
+FRAME_HEADER = struct.Struct('>I')  # Length of the message that follows.
+MAX_MESSAGE_SIZE = 2 ** 26
+
+
+def send_message(sock, data):
+    """Send a message preceded by its length.
+
+    Args:
+        sock (socket): Connected socket.
+        data (str/bytes-like): Message.
+
+    """
+    if type(data) is str:
+        data = data.encode()
+    sock.sendall(FRAME_HEADER.pack(len(data)) + data)
+
+
+def receive_into(sock, view):
+    """Fill 'view' with data from the socket.
+
+    Args:
+        sock (socket): Connected socket.
+        view (memoryview): Buffer to fill.
+
+    Returns:
+        (int): Number of bytes received, less than len(view) only if the connection was closed.
+
+    """
+    received = 0
+    while received < len(view):
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            break
+        received += n
+    return received
+
+
+def receive_message(sock, max_size=MAX_MESSAGE_SIZE):
+    """Receive a whole message sent with send_message().
+
+    Args:
+        sock (socket): Connected socket.
+        max_size (int): Largest message accepted.
+
+    Returns:
+        (None/bytearray): Message, None if the connection was closed between two messages.
+
+    """
+    header = bytearray(FRAME_HEADER.size)
+    received = receive_into(sock, memoryview(header))
+    if received == 0:
+        return None
+    if received < len(header):
+        raise ConnectionError("Connection closed inside a message header.")
+    size, = FRAME_HEADER.unpack(header)
+    if size > max_size:
+        raise ValueError("Message too large.")
+    data = bytearray(size)
+    if receive_into(sock, memoryview(data)) < size:
+        raise ConnectionError("Connection closed inside a message.")
+    return data
 
 
 class Client:
@@ -23,6 +87,10 @@ class Client:
         else:
             self.sock.sendall(data)
 
+    def send_message(self, data):
+        """Send a framed message, see send_message()."""
+        send_message(self.sock, data)
+
     def close(self):
         self.sock.close()
         print("Client closed")
@@ -42,6 +110,17 @@ class Server:
     def receive(self):
         return self.client.recv(2 ** 15)
 
+    def receive_message(self, max_size=MAX_MESSAGE_SIZE):
+        """Receive a whole framed message, see receive_message()."""
+        return receive_message(self.client, max_size)
+
+    def receive_messages(self, max_size=MAX_MESSAGE_SIZE):
+        """Iterate over the framed messages until the client closes the connection."""
+        message = self.receive_message(max_size)
+        while message is not None:
+            yield message
+            message = self.receive_message(max_size)
+
     def close(self):
         self.client.close()
         self.sock.close()
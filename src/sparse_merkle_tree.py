@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Sparse Merkle tree over a key space of 2^depth leaves.
+  Created:  18/10/2026
+"""
+
+from hash_functions import get_hash_function
+from merkle_tree import MerkleTree
+
+
+class SparseMerkleTree:
+    """Sparse Merkle tree.
+
+    Every key of the 2^depth key space is a leaf: the hash of its value, or the empty leaf
+    (digest_size zero bytes) for the keys without value. Every subtree without any key is
+    then a default hash, precomputed per level, so only the nodes above the keys are stored:
+    storage and updates cost O(keys × depth). The tree of depth d with every key set is the
+    MerkleTree of 2^d leaves, and proofs are its authentification paths.
+
+    Attributes:
+        depth (int): Number of levels above the leaves, keys are in [0, 2^depth).
+        hash_function (HashFunction): Hash function of the values and of the internal nodes.
+        defaults (list): Hash of an empty subtree of each level, from the empty leaf to the empty root.
+        levels (list): Index -> hash of the nodes that are not empty, for each level from the leaves.
+
+    """
+
+    def __init__(self, depth=256, hash_function=None):
+        """SparseMerkleTree object constructor.
+
+        Args:
+            depth (int): Number of levels above the leaves.
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+        """
+        if depth < 1:
+            raise ValueError("Wrong depth.")
+        self.depth = depth
+        self.hash_function = get_hash_function(hash_function)
+        self.defaults = self.default_hashes(depth, self.hash_function)
+        self.levels = [{} for _ in range(depth + 1)]
+
+    @staticmethod
+    def default_hashes(depth, hash_function=None):
+        """Hashes of the empty subtrees of each level.
+
+        Args:
+            depth (int): Number of levels above the leaves.
+            hash_function (None/str/HashFunction): Hash function, sha256 if None.
+
+        Returns:
+            (list): depth + 1 hashes, from the empty leaf to the empty root.
+
+        """
+        hash_function = get_hash_function(hash_function)
+        defaults = [bytes(hash_function.digest_size)]
+        for _ in range(depth):
+            defaults.append(hash_function.digest(defaults[-1] * 2))
+        return defaults
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    def __contains__(self, key):
+        return self.key_index(key) in self.levels[0]
+
+    def key_index(self, key):
+        """Get the leaf index of a key.
+
+        Args:
+            key (int/bytes-like): Leaf index, or its big-endian bytes.
+
+        Returns:
+            (int): Leaf index.
+
+        """
+        if type(key) is not int:
+            key = int.from_bytes(key, 'big')
+        if not 0 <= key < 1 << self.depth:
+            raise KeyError(key)
+        return key
+
+    def get(self, key):
+        """Get the leaf of a key.
+
+        Args:
+            key (int/bytes-like): Key, see key_index().
+
+        Returns:
+            (None/bytes): Hash of the value, None if the key has no value.
+
+        """
+        return self.levels[0].get(self.key_index(key))
+
+    def set(self, key, value, hashed=False):
+        """Set the value of a key, see update().
+
+        Args:
+            key (int/bytes-like): Key, see key_index().
+            value (str/bytes-like/None): Value, None to remove the key.
+            hashed (boolean): 'value' already hashed or not.
+
+        """
+        self.update({key: value}, hashed)
+
+    def delete(self, key):
+        """Remove the value of a key."""
+        self.update({key: None})
+
+    def update(self, items, hashed=False):
+        """Set the values of several keys, re-hashing each common ancestor once.
+
+        Args:
+            items (dict/iterable): Key -> value, or (key, value) pairs, a None value removes the key.
+            hashed (boolean): values already hashed or not.
+
+        """
+        items = items.items() if isinstance(items, dict) else items
+        leaves = self.levels[0]
+        changed = set()
+        for key, value in items:
+            index = self.key_index(key)
+            if value is None:
+                leaves.pop(index, None)
+            elif hashed:
+                value = bytes.fromhex(value) if type(value) is str else bytes(value)
+                if len(value) != self.hash_function.digest_size:
+                    raise ValueError("Wrong leaf hash size.")
+                leaves[index] = value
+            else:
+                leaves[index] = bytes(self.hash_function.hash_message(value))
+            changed.add(index)
+        digest = self.hash_function.digest
+        for level in range(self.depth):
+            children, parents = self.levels[level], self.levels[level + 1]
+            default = self.defaults[level]
+            changed = set(index >> 1 for index in changed)
+            for index in changed:
+                left = children.get(2 * index)
+                right = children.get(2 * index + 1)
+                if left is None and right is None:
+                    parents.pop(index, None)
+                else:
+                    parents[index] = digest((left or default) + (right or default))
+
+    def get_root(self):
+        """Get root of the tree.
+
+        Returns:
+            (bytearray): Root hash.
+
+        """
+        return bytearray(self.levels[self.depth].get(0, self.defaults[self.depth]))
+
+    def get_authentification_path_hashes(self, key):
+        """Authentification path of a key, proving its value or that it has none.
+
+        Args:
+            key (int/bytes-like): Key, see key_index().
+
+        Returns:
+            (list) List which contains [auth(0), ..., auth(depth-1)].
+
+        """
+        index = self.key_index(key)
+        path = []
+        for level in range(self.depth):
+            path.append(self.levels[level].get(index ^ 1, self.defaults[level]))
+            index >>= 1
+        return path
+
+    def verify_membership(self, key, value, path, root, hashed=False):
+        """Check that a key has a value under a root.
+
+        Args:
+            key (int/bytes-like): Key, see key_index().
+            value (str/bytes-like): Value.
+            path (list): [auth(0), ..., auth(depth-1)], see get_authentification_path_hashes().
+            root (bytes-like): Root hash.
+            hashed (boolean): 'value' already hashed or not.
+
+        Returns:
+            (boolean): True if the path leads from the value to the root otherwise False.
+
+        """
+        leaf = value if hashed else self.hash_function.hash_message(value)
+        return len(path) == self.depth and MerkleTree.verify_auth_path(
+            leaf, self.key_index(key), path, root, self.hash_function)
+
+    def verify_non_membership(self, key, path, root):
+        """Check that a key has no value under a root.
+
+        Args:
+            key (int/bytes-like): Key, see key_index().
+            path (list): [auth(0), ..., auth(depth-1)], see get_authentification_path_hashes().
+            root (bytes-like): Root hash.
+
+        Returns:
+            (boolean): True if the path leads from the empty leaf to the root otherwise False.
+
+        """
+        return len(path) == self.depth and MerkleTree.verify_auth_path(
+            self.defaults[0], self.key_index(key), path, root, self.hash_function)
+
+
+def main():
+    smt = SparseMerkleTree()
+    smt.update({smt.hash_function.digest(str(i).encode()): str(i) for i in range(1000)})
+    root = smt.get_root()
+    key = smt.hash_function.digest(b"42")
+    print("Membership of 42:", smt.verify_membership(key, "42", smt.get_authentification_path_hashes(key), root))
+    key = smt.hash_function.digest(b"absent")
+    print("Non-membership of 'absent':", smt.verify_non_membership(key, smt.get_authentification_path_hashes(key), root))
+    print("Stored nodes:", sum(len(level) for level in smt.levels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the hash functions
+  Created:  18/10/2026
+"""
+
+import hash_functions
+import hashlib
+import io
+import os
+import pathlib
+import pickle
+import tempfile
+import unittest
+
+
+class hash_function_test(unittest.TestCase):
+
+    """Tests the HashFunction methods"""
+
+    def test_digest(self):
+        """Tests digest and __call__ against hashlib"""
+        self.assertEqual(hashlib.sha256(b"abc").digest(), hash_functions.SHA256.digest(b"abc"))
+        self.assertEqual(bytearray(hashlib.sha256(b"abc").digest()), hash_functions.SHA256("abc"))
+        self.assertEqual(hashlib.sha3_256(b"abc").digest(), hash_functions.HashFunction('sha3_256').digest(b"abc"))
+        self.assertEqual(hashlib.new('sha512_256', b"abc").digest(),
+                         hash_functions.HashFunction('sha512_256').digest(b"abc"))
+        self.assertEqual(hashlib.blake2b(b"abc", digest_size=32).digest(),
+                         hash_functions.HashFunction('blake2b').digest(b"abc"))
+        self.assertEqual(hashlib.blake2s(b"abc").digest(), hash_functions.HashFunction('blake2s').digest(b"abc"))
+
+    def test_digest_size(self):
+        """Tests truncated digests"""
+        sha256 = hash_functions.HashFunction('sha256', 16)
+        self.assertEqual(hashlib.sha256(b"abc").digest()[:16], sha256.digest(b"abc"))
+        h = sha256.new(b"a")
+        h.update(b"bc")
+        self.assertEqual(sha256.digest(b"abc"), sha256.finalize(h))
+        blake2b = hash_functions.HashFunction('blake2b', 20)
+        self.assertEqual(hashlib.blake2b(b"abc", digest_size=20).digest(), blake2b.digest(b"abc"))
+        self.assertEqual(blake2b.digest(b"abc"), blake2b.finalize(blake2b.new(b"abc")))
+        self.assertRaises(ValueError, hash_functions.HashFunction, 'sha256', 64)
+        self.assertRaises(ValueError, hash_functions.HashFunction, 'sha256', 0)
+        self.assertRaises(ValueError, hash_functions.HashFunction, 'md5')
+
+    def test_get_hash_function(self):
+        """Tests get_hash_function"""
+        self.assertIs(hash_functions.SHA256, hash_functions.get_hash_function())
+        blake2s = hash_functions.HashFunction('blake2s')
+        self.assertIs(blake2s, hash_functions.get_hash_function(blake2s))
+        self.assertEqual(blake2s, hash_functions.get_hash_function('blake2s'))
+        self.assertNotEqual(blake2s, hash_functions.get_hash_function('blake2s', 16))
+
+    def test_digest_file(self):
+        """Tests digest_file, digest_chunks and hash_message"""
+        data = os.urandom(10000)
+        sha256 = hash_functions.SHA256
+        expected = hashlib.sha256(data).digest()
+        self.assertEqual(expected, sha256.digest_file(io.BytesIO(data), read_size=4096))
+        self.assertEqual(expected, sha256.digest_chunks([data[:3000], data[3000:], b""]))
+        self.assertEqual(bytearray(expected), sha256.hash_message(io.BytesIO(data)))
+        self.assertEqual(bytearray(expected), sha256.hash_message(data[i:i + 999] for i in range(0, len(data), 999)))
+        self.assertEqual(sha256("abc"), sha256.hash_message("abc"))
+        self.assertEqual(sha256("abc"), sha256.hash_message(["a", "bc"]))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data")
+            with open(path, 'wb') as f:
+                f.write(data)
+            self.assertEqual(expected, sha256.digest_file(path, read_size=1000))
+            self.assertEqual(bytearray(expected), sha256.hash_message(pathlib.Path(path)))
+            with open(path, 'rb') as f:
+                f.seek(10)
+                self.assertEqual(hashlib.sha256(data[10:]).digest(), sha256.digest_file(f))
+
+    def test_chunk_hashes(self):
+        """Tests chunk_hashes with and without mmap"""
+        data = os.urandom(10000)
+        expected = b"".join(hashlib.sha256(data[i:i + 1024]).digest() for i in range(0, len(data), 1024))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data")
+            with open(path, 'wb') as f:
+                f.write(data)
+            for mmap in (True, False):
+                batches = list(hash_functions.chunk_hashes(path, 1024, mmap=mmap, batch_size=4))
+                self.assertEqual([128, 128, 64], [len(i) for i in batches])
+                self.assertEqual(expected, b"".join(batches))
+            open(path, 'wb').close()
+            for mmap in (True, False):
+                self.assertEqual([], list(hash_functions.chunk_hashes(path, 1024, mmap=mmap)))
+
+    def test_pickle(self):
+        """Tests that hash functions can be sent to other processes"""
+        blake2b = hash_functions.HashFunction('blake2b', 24)
+        copy = pickle.loads(pickle.dumps(blake2b))
+        self.assertEqual(blake2b, copy)
+        self.assertEqual(blake2b.digest(b"abc"), copy.digest(b"abc"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@
 import lamport
 import unittest
 import hashlib
+import io
 from os import urandom
 
 class lamport_signature_test(unittest.TestCase):
@@ -30,6 +31,68 @@ class lamport_signature_test(unittest.TestCase):
             noDifference = noDifference and ((self.ls.hash(tuple[0]),self.ls.hash(tuple[1])) == self.ls.public_key[i])
         self.assertTrue(noDifference)
 
+    def test_generate_keys(self):
+        """Tests generate_keys"""
+        for workers in (1, 2):
+            keys = lamport.LamportSignature.generate_keys(3, workers=workers)
+            self.assertEqual(len(keys), 3)
+            self.assertEqual(type(keys[2].private_key[0][0]), bytearray)
+            self.assertNotEqual(keys[0].private_key, keys[1].private_key)
+            for key in keys:
+                self.assertEqual(key.public_key, [(key.hash(a), key.hash(b)) for a, b in key.private_key])
+
+    def test_message_bits(self):
+        """Tests message_bits"""
+        bits = self.ls.message_bits('abc')
+        msg_hash = hashlib.sha256('abc'.encode('utf-8')).digest()
+        self.assertEqual(len(bits), 256)
+        self.assertEqual(int.from_bytes(msg_hash, 'big'), int(''.join(str(i) for i in bits), 2))
+
+    def test_verify_buffers(self):
+        """Tests verify with contiguous signature and public key"""
+        msg = 'Ceci est un message test'
+        signature = self.ls.sign(msg)
+        public_key = self.ls.get_key('public', True)
+        self.assertTrue(self.ls.verify(msg, self.ls.concatenate_key(signature), public_key))
+        self.assertTrue(self.ls.verify(msg, signature, public_key))
+        self.assertFalse(self.ls.verify('Ceci est un autre message test', self.ls.concatenate_key(signature), public_key))
+        self.assertFalse(self.ls.verify(msg, signature[:255], self.ls.public_key))
+        self.assertFalse(self.ls.verify(msg, self.ls.concatenate_key(signature)[:-32], public_key))
+
+    def test_seed(self):
+        """Tests keys derived from a seed"""
+        seed = urandom(32)
+        ls = lamport.LamportSignature(seed=seed, index=5)
+        self.assertIsNone(ls.private_key_buffer)
+        self.assertEqual(ls.public_key, [(ls.hash(a), ls.hash(b)) for a, b in ls.private_key])
+        self.assertEqual(ls.get_key('public', True), lamport.LamportSignature(seed=seed, index=5).get_key('public', True))
+        self.assertNotEqual(ls.public_key, lamport.LamportSignature(seed=seed, index=6).public_key)
+        self.assertEqual(ls.get_key('private', True)[64:96], lamport.derive_private_half(seed, 5, 1, 0))
+        signature = ls.sign('Ceci est un message test')
+        self.assertTrue(ls.verify('Ceci est un message test', signature, ls.public_key))
+        self.assertFalse(ls.verify('Ceci est un autre message test', signature, ls.public_key))
+
+    def test_sign_file(self):
+        """Tests sign and verify of a message read from a file object or from chunks"""
+        msg = urandom(100000)
+        signature = self.ls.sign(io.BytesIO(msg))
+        self.assertTrue(self.ls.verify(msg, signature, self.ls.public_key))
+        self.assertTrue(self.ls.verify([msg[:10], msg[10:]], signature, self.ls.public_key))
+        self.assertFalse(self.ls.verify(io.BytesIO(msg[1:]), signature, self.ls.public_key))
+
+    def test_hash_function(self):
+        """Tests keys with another hash function"""
+        msg = 'Ceci est un message test'
+        ls = lamport.LamportSignature(hash_function='blake2s')
+        self.assertEqual(ls.public_key[3][1], hashlib.blake2s(ls.private_key[3][1]).digest())
+        signature = ls.sign(msg)
+        self.assertTrue(ls.verify(msg, signature, ls.public_key, ls.hash_function))
+        self.assertFalse(ls.verify(msg, signature, ls.public_key))
+        keys = lamport.LamportSignature.generate_keys(2, workers=2, hash_function='sha3_256')
+        self.assertEqual(keys[1].public_key[0][0], hashlib.sha3_256(keys[1].private_key[0][0]).digest())
+        self.assertRaises(ValueError, lamport.LamportSignature, hash_function=lamport.get_hash_function('blake2b', 64))
+        self.assertRaises(ValueError, lamport.LamportSignature, hash_function=lamport.get_hash_function('sha256', 16))
+
     def test_concatenate_key(self):
         """Tests concatenate_key"""
         key = [(bytearray(urandom(32)), bytearray(urandom(32))) for i in range(256)]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the append-only Merkle tree
+  Created:  18/10/2026
+"""
+
+import merkle_log
+import merkle_tree
+import merkle_tree_builder
+import unittest
+
+
+class merkle_log_test(unittest.TestCase):
+
+    """Tests the MerkleLog methods"""
+
+    def setUp(self):
+        """Initialization"""
+        self.log = merkle_log.MerkleLog()
+        self.log.extend(str(i) for i in range(40))
+
+    def test_append(self):
+        """Tests append and get_root against MerkleTreeBuilder and MerkleTree"""
+        log = merkle_log.MerkleLog()
+        for size in range(1, 34):
+            self.assertEqual(size - 1, log.append(str(size - 1)))
+            self.assertEqual(merkle_tree_builder.streaming_root(str(i) for i in range(size)), log.get_root())
+        self.assertEqual(33, len(log))
+        mk = merkle_tree.MerkleTree(n_leaves=32)
+        mk.add_leaves(str(i) for i in range(32))
+        mk.generate_tree()
+        self.assertEqual(mk.get_root(), log.get_root(32))
+        self.assertEqual(mk.get_authentification_path_hashes(5), log.get_inclusion_proof(5, 32))
+        self.assertEqual(bytes(mk.tree[2, 3]), log.get_node(2, 3))
+        self.assertRaises(KeyError, log.get_node, 5, 1)
+        self.assertRaises(ValueError, merkle_log.MerkleLog().get_root)
+
+    def test_get_root(self):
+        """Tests the roots of former sizes"""
+        for size in range(1, 41):
+            self.assertEqual(merkle_tree_builder.streaming_root(str(i) for i in range(size)), self.log.get_root(size))
+        self.assertRaises(ValueError, self.log.get_root, 41)
+
+    def test_inclusion(self):
+        """Tests get_inclusion_proof and verify_inclusion"""
+        for size in range(1, 41):
+            root = self.log.get_root(size)
+            for index in range(size):
+                leaf = self.log.get_node(0, index)
+                path = self.log.get_inclusion_proof(index, size)
+                self.assertTrue(self.log.verify_inclusion(leaf, index, size, path, root))
+                self.assertFalse(self.log.verify_inclusion(leaf, index, size, path, self.log.get_root(size % 40 + 1)))
+                if size > 1:
+                    self.assertFalse(self.log.verify_inclusion(leaf, index ^ 1, size, path, root))
+                    self.assertFalse(self.log.verify_inclusion(leaf, index, size, path[:-1], root))
+        self.assertFalse(self.log.verify_inclusion(self.log.get_node(0, 3), 40, 40, [], self.log.get_root()))
+
+    def test_consistency(self):
+        """Tests get_consistency_proof and verify_consistency"""
+        for new_size in range(1, 41):
+            new_root = self.log.get_root(new_size)
+            for old_size in range(1, new_size + 1):
+                old_root = self.log.get_root(old_size)
+                proof = self.log.get_consistency_proof(old_size, new_size)
+                self.assertTrue(self.log.verify_consistency(old_size, new_size, old_root, new_root, proof))
+                if old_size < new_size:
+                    self.assertFalse(self.log.verify_consistency(old_size, new_size, new_root, new_root, proof))
+                    self.assertFalse(self.log.verify_consistency(old_size, new_size, old_root, new_root, proof[1:]))
+                    self.assertFalse(self.log.verify_consistency(old_size, new_size, old_root, self.log.get_root(), proof[:-1]))
+        other = merkle_log.MerkleLog()
+        other.extend(str(i) for i in range(10))
+        other.append("forked")
+        self.assertFalse(self.log.verify_consistency(10, 11, self.log.get_root(10), other.get_root(),
+                                                     self.log.get_consistency_proof(10, 11)))
+        self.assertRaises(ValueError, self.log.get_consistency_proof, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
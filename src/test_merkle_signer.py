@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for Merkle signature scheme signer
+  Created:  18/10/2026
+"""
+
+import hash_functions
+import merkle_signer
+import merkle_tree
+import unittest
+
+
+class merkle_signer_test(unittest.TestCase):
+
+    """Tests the MerkleSigner methods"""
+
+    def setUp(self):
+        """Initialization"""
+        self.signer = merkle_signer.MerkleSigner(height=4, seed=bytes(32))
+        self.mk = merkle_tree.MerkleTree(n_leaves=16)
+        self.mk.add_leaves([self.signer.leaf(i) for i in range(16)], hashed=True)
+        self.mk.generate_tree()
+
+    def test_root(self):
+        """Tests the root computed at key generation"""
+        self.assertEqual(self.mk.get_root(), self.signer.root)
+        self.assertEqual(self.signer.root, merkle_signer.MerkleSigner(height=4, seed=bytes(32)).root)
+
+    def test_sign(self):
+        """Tests sign and the authentification paths of every leaf"""
+        for i in range(16):
+            self.assertEqual(16 - i, self.signer.remaining())
+            index, signature = self.signer.sign("test {}".format(i))
+            self.assertEqual(i, index)
+            self.assertEqual(self.mk.get_authentification_path_hashes(i), signature[2])
+            self.assertTrue(merkle_signer.MerkleSigner.verify("test {}".format(i), index, signature, self.signer.root))
+            self.assertFalse(merkle_signer.MerkleSigner.verify("test", index, signature, self.signer.root))
+        self.assertRaises(ValueError, self.signer.sign, "test")
+
+    def test_hash_function(self):
+        """Tests a signer with another hash function"""
+        signer = merkle_signer.MerkleSigner(height=2, seed=bytes(32), hash_function='sha3_256')
+        mk = merkle_tree.MerkleTree(n_leaves=4, hash_function='sha3_256')
+        mk.add_leaves([signer.leaf(i) for i in range(4)], hashed=True)
+        mk.generate_tree()
+        self.assertEqual(mk.get_root(), signer.root)
+        self.assertNotEqual(self.signer.leaf(0), signer.leaf(0))
+        index, signature = signer.sign("test")
+        self.assertEqual(mk.get_authentification_path_hashes(0), signature[2])
+        self.assertTrue(merkle_signer.MerkleSigner.verify("test", index, signature, signer.root, 'sha3_256'))
+        self.assertFalse(merkle_signer.MerkleSigner.verify("test", index, signature, signer.root))
+        self.assertRaises(ValueError, merkle_signer.MerkleSigner, 2,
+                          hash_function=hash_functions.get_hash_function('blake2b', 64))
+
+    def test_restart(self):
+        """Tests a signer restarted from its seed and index"""
+        for i in (0, 1, 3, 4, 5, 11, 15, 16):
+            signer = merkle_signer.MerkleSigner(height=4, seed=bytes(32), index=i)
+            self.assertEqual((i, self.signer.root), (signer.index, signer.root))
+            for j in range(i, min(i + 3, 16)):
+                self.assertEqual(self.mk.get_authentification_path_hashes(j), signer.sign("test")[1][2])
+        self.assertRaises(ValueError, signer.sign, "test")
+        self.assertRaises(ValueError, merkle_signer.MerkleSigner, 4, bytes(32), index=17)
+
+    def test_tree_hash(self):
+        """Tests TreeHash"""
+        treehash = merkle_signer.TreeHash(2, start_leaf=4)
+        while treehash.low() is not None:
+            treehash.update(lambda i: bytes(self.mk.tree[0, i]))
+        self.assertEqual(self.mk.tree[2, 1], treehash.node)
+        self.assertEqual(8, treehash.next_leaf)
+
+
+class hypertree_signer_test(unittest.TestCase):
+
+    """Tests the HypertreeSigner methods"""
+
+    def test_sign(self):
+        """Tests sign and verify across subtrees"""
+        signer = merkle_signer.HypertreeSigner(layers=2, subtree_height=2, seed=bytes(32))
+        self.assertEqual([0, 0], signer.tree_index)
+        for i in range(16):
+            signature = signer.sign("test {}".format(i))
+            self.assertEqual(2, len(signature))
+            self.assertEqual((i % 4, i // 4), (signature[0][0], signature[1][0]))
+            self.assertTrue(signer.verify("test {}".format(i), signature, signer.root, 2))
+            self.assertFalse(signer.verify("test", signature, signer.root, 2))
+        self.assertEqual([3, 0], signer.tree_index)
+        self.assertRaises(ValueError, signer.sign, "test")
+
+    def test_restart(self):
+        """Tests a hypertree restarted from its seed and number of signatures"""
+        signer = merkle_signer.HypertreeSigner(layers=2, subtree_height=2, seed=bytes(32))
+        signatures = [signer.sign("test {}".format(i)) for i in range(16)]
+        self.assertEqual(16, signer.index)
+        for i in (0, 1, 3, 4, 5, 11, 15, 16):
+            restarted = merkle_signer.HypertreeSigner(layers=2, subtree_height=2, seed=bytes(32), index=i)
+            self.assertEqual((i, signer.root), (restarted.index, restarted.root))
+            for j in range(i, min(i + 3, 16)):
+                self.assertEqual(signatures[j], restarted.sign("test {}".format(j)))
+        self.assertRaises(ValueError, restarted.sign, "test")
+        self.assertRaises(ValueError, merkle_signer.HypertreeSigner, 2, 2, bytes(32), index=17)
+
+    def test_truncated_signature(self):
+        """Tests that the root signature of a layer is not a signature on its own"""
+        signer = merkle_signer.HypertreeSigner(layers=2, subtree_height=2, seed=bytes(32))
+        signature = signer.sign("hello")
+        bottom_root = bytearray(signer.signers[0].root)
+        self.assertFalse(signer.verify(bottom_root, signature[1:], signer.root, 2))
+        self.assertFalse(signer.verify(bottom_root, signature[1:], signer.root, 1))
+        self.assertFalse(signer.verify("hello", signature[:1], signer.root, 2))
+        self.assertFalse(signer.verify("hello", signature + signature[1:], signer.root, 3))
+
+    def test_hash_function(self):
+        """Tests a hypertree with another hash function"""
+        signer = merkle_signer.HypertreeSigner(layers=2, subtree_height=2, seed=bytes(32), hash_function='blake2b')
+        signature = signer.sign("test")
+        self.assertTrue(signer.verify("test", signature, signer.root, 2, 'blake2b'))
+        self.assertFalse(signer.verify("test", signature, signer.root, 2))
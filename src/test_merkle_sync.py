@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for Merkle tree synchronization
+  Created:  18/10/2026
+"""
+
+import merkle_sync
+import merkle_tree
+import socket
+import socket_client_server
+import threading
+import unittest
+
+
+class merkle_sync_test(unittest.TestCase):
+
+    """Tests serve_sync and RemoteTree"""
+
+    def setUp(self):
+        """Initialization"""
+        self.local = merkle_tree.MerkleTree(n_leaves=64)
+        self.remote = merkle_tree.MerkleTree(n_leaves=64)
+        self.local.add_leaves(str(i) for i in range(64))
+        self.remote.add_leaves(str(i) for i in range(64))
+        self.a, self.b = socket.socketpair()
+
+    def tearDown(self):
+        self.a.close()
+        self.b.close()
+
+    def serve(self, tree):
+        results = []
+        thread = threading.Thread(target=lambda: results.append(merkle_sync.serve_sync(self.a, tree)))
+        thread.start()
+        return thread, results
+
+    def test_diff(self):
+        """Tests a diff against a remote tree"""
+        for index in (5, 40, 41):
+            self.remote.add_node("changed", (0, index))
+        self.remote.add_node(None, (0, 63))
+        self.local.generate_tree()
+        self.remote.generate_tree()
+        thread, results = self.serve(self.remote)
+        remote = merkle_sync.RemoteTree(self.b)
+        self.assertEqual((64, self.remote.hash_function), (remote.n_leaves, remote.hash_function))
+        self.assertEqual([5, 40, 41, 63], self.local.diff(remote))
+        self.assertEqual(self.local.diff(self.remote), self.local.diff(remote))
+        self.assertLess(remote.fetched, 64)
+        self.assertEqual(list(self.remote.get_nodes(0, [5, 63])), remote.get_nodes(0, [5, 63]))
+        self.b.shutdown(socket.SHUT_WR)
+        thread.join()
+        self.assertEqual([remote.requests], results)
+
+    def test_same_trees(self):
+        """Tests a diff of identical trees"""
+        self.local.generate_tree()
+        self.remote.generate_tree()
+        thread, results = self.serve(self.remote)
+        remote = merkle_sync.RemoteTree(self.b)
+        self.assertEqual([], self.local.diff(remote))
+        self.assertEqual(1, remote.fetched)
+        self.b.shutdown(socket.SHUT_WR)
+        thread.join()
+
+    def test_wrong_requests(self):
+        """Tests the requests rejected by serve_sync"""
+        self.remote.generate_tree()
+        for request in (merkle_sync.REQUEST.pack(merkle_sync.REQUEST_NODES, 0, 1) + merkle_sync.NODE_INDEX.pack(64),
+                        merkle_sync.REQUEST.pack(merkle_sync.REQUEST_NODES, 0, 2),
+                        merkle_sync.REQUEST.pack(9, 0, 0)):
+            socket_client_server.send_message(self.b, request)
+            self.assertRaises(ValueError, merkle_sync.serve_sync, self.a, self.remote)
+
+    def test_wrong_shape(self):
+        """Tests a diff of trees of different sizes"""
+        other = merkle_tree.MerkleTree(n_leaves=32)
+        self.local.generate_tree()
+        self.assertRaises(ValueError, self.local.diff, other)
+        self.assertRaises(ValueError, self.local.diff, merkle_tree.MerkleTree(n_leaves=64, hash_function='blake2s'))
+
+
+if __name__ == '__main__':
+    unittest.main()
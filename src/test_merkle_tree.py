@@ -8,6 +8,8 @@
 import merkle_tree
 import unittest
 import hashlib
+import os
+import tempfile
 
 
 class merkle_tree_test(unittest.TestCase):
@@ -50,6 +52,24 @@ class merkle_tree_test(unittest.TestCase):
         self.assertEqual(data3,self.mk.tree[position3])
         self.assertEqual(bytearray(hashlib.sha256(data4.encode('utf-8')).digest()),self.mk.tree[position4])
 
+    def test_add_leaves(self):
+        """Tests add_leaves"""
+        data = ["test", "retest", "test", "world", "test", "again", "test", "andagain"]
+        mk = merkle_tree.MerkleTree(n_leaves=8)
+        mk.add_leaves(data[:4])
+        mk.add_leaves([i.encode('utf-8') for i in data[4:6]], start=4)
+        mk.add_leaves([hashlib.sha256(i.encode('utf-8')).digest().hex() for i in data[6:]], start=6, hashed=True)
+        mk.generate_tree()
+        self.assertEqual(self.mk.get_root(), mk.get_root())
+
+        mk = merkle_tree.MerkleTree(n_leaves=8)
+        mk.add_leaves(b"".join(hashlib.sha256(i.encode('utf-8')).digest() for i in data), hashed=True)
+        mk.generate_tree()
+        self.assertEqual(self.mk.get_root(), mk.get_root())
+
+        self.assertRaises(ValueError, mk.add_leaves, ["test"], start=8)
+        self.assertRaises(ValueError, mk.add_leaves, bytes(33), hashed=True)
+
     def test_generate_tree(self):
         """Tests generate_tree"""
         node_0_0 = bytearray(hashlib.sha256("test".encode('utf-8')).digest())
@@ -76,12 +96,180 @@ class merkle_tree_test(unittest.TestCase):
         self.assertEqual(node_2_1, self.mk.tree[2, 1])
         self.assertEqual(node_3_0, self.mk.tree[3, 0])
 
+    def test_generate_tree_incremental(self):
+        """Tests generate_tree after leaf updates"""
+        self.assertEqual(set(), self.mk.dirty)
+        self.mk.add_node("updated", (0, 5))
+        self.mk.add_node("updated", (0, 6))
+        self.assertEqual({6, 7}, self.mk.dirty)  # Parents of the leaves 5 and 6.
+        self.mk.generate_tree()
+        self.assertEqual(set(), self.mk.dirty)
+
+        expected = merkle_tree.MerkleTree(n_leaves=8)
+        for i, data in enumerate(("test", "retest", "test", "world", "test", "updated", "updated", "andagain")):
+            expected.add_node(data, (0, i))
+        expected.generate_tree()
+        self.assertEqual(expected.get_root(), self.mk.get_root())
+
+    def test_generate_tree_parallel(self):
+        """Tests generate_tree with several workers"""
+        for n_leaves, workers, missing in ((8, 2, None), (64, 4, None), (64, 3, 63)):
+            serial = merkle_tree.MerkleTree(n_leaves=n_leaves)
+            parallel = merkle_tree.MerkleTree(n_leaves=n_leaves)
+            for i in range(n_leaves):
+                serial.add_node(str(i), (0, i))
+                parallel.add_node(str(i), (0, i))
+            if missing is not None:  # Incomplete last subtree.
+                parallel.add_node(None, (0, missing))
+                serial.add_node(None, (0, missing))
+            serial.generate_tree()
+            parallel.generate_tree(workers=workers)
+            self.assertEqual(list(serial.tree.items()), list(parallel.tree.items()))
+
     def test_get_root(self):
         """Tests get_root"""
         root = self.mk.get_root()
         self.assertIs(type(root),bytearray)
         self.assertEqual(root, self.mk.tree[3, 0])
 
+    def test_compute_root(self):
+        """Tests compute_root"""
+        path = self.mk.get_authentification_path_hashes(5)
+        self.assertEqual(self.mk.get_root(), self.mk.compute_root(self.mk.tree[0, 5], 5, path))
+        self.assertIsNone(self.mk.compute_root(self.mk.tree[0, 5], 8, path))
+
+    def test_verify_auth_path(self):
+        """Tests verify_auth_path"""
+        root = self.mk.get_root()
+        for index in range(8):
+            leaf = self.mk.tree[0, index]
+            path = self.mk.get_authentification_path_hashes(index)
+            self.assertTrue(self.mk.verify_auth_path(leaf, index, path, root))
+            self.assertFalse(self.mk.verify_auth_path(leaf, index ^ 1, path, root))
+        self.assertFalse(self.mk.verify_auth_path(self.mk.tree[0, 0], 8, self.mk.get_authentification_path_hashes(0), root))
+
+    def test_verify_auth_paths(self):
+        """Tests verify_auth_paths"""
+        root = self.mk.get_root()
+        proofs = [(self.mk.tree[0, i], i, self.mk.get_authentification_path_hashes(i)) for i in range(8)]
+        proofs.append((self.mk.tree[0, 0], 1, self.mk.get_authentification_path_hashes(1)))
+        proofs.append((self.mk.tree[0, 2], 2, self.mk.get_authentification_path_hashes(2)[:2]))
+        self.assertEqual([True] * 8 + [False, False], self.mk.verify_auth_paths(proofs, root))
+        self.assertEqual([False], self.mk.verify_auth_paths(proofs[:1], bytes(32)))
+        self.assertEqual([False] + [True] * 8, self.mk.verify_auth_paths([proofs[-1]] + proofs[:8], root))
+        self.assertEqual([False] * 2 + [True] * 8, self.mk.verify_auth_paths(proofs[-2:] + proofs[:8], root))
+
+    def test_get_multiproof(self):
+        """Tests get_multiproof"""
+        self.assertEqual([(0, 7), (1, 2), (2, 0)], self.mk.get_multiproof([6]))
+        self.assertEqual([(0, 0), (0, 7), (1, 1), (1, 2)], self.mk.get_multiproof([1, 6]))
+        self.assertEqual([(1, 1), (2, 1)], self.mk.get_multiproof([0, 1]))
+
+    def test_verify_multiproof(self):
+        """Tests verify_multiproof"""
+        root = self.mk.get_root()
+        for indexes in ([6], [1, 6], [0, 1], [0, 3, 4, 7], range(8)):
+            leaves = {i: self.mk.tree[0, i] for i in indexes}
+            proof = self.mk.get_multiproof_hashes(indexes)
+            self.assertTrue(self.mk.verify_multiproof(leaves, proof, 8, root))
+            self.assertFalse(self.mk.verify_multiproof(leaves, proof + [bytes(32)], 8, root))
+        leaves = {1: self.mk.tree[0, 1], 6: self.mk.tree[0, 6]}
+        proof = self.mk.get_multiproof_hashes([1, 6])
+        self.assertFalse(self.mk.verify_multiproof(leaves, proof[:-1], 8, root))
+        self.assertFalse(self.mk.verify_multiproof(leaves, proof + [None], 8, root))
+        self.assertFalse(self.mk.verify_multiproof({1: self.mk.tree[0, 6], 6: self.mk.tree[0, 1]}, proof, 8, root))
+        mk = merkle_tree.MerkleTree(n_leaves=8)
+        mk.add_node("1", (0, 1))
+        mk.add_node("6", (0, 6))
+        proof = mk.get_multiproof_hashes([1, 6])
+        self.assertIn(None, proof)
+        self.assertFalse(mk.verify_multiproof({1: mk.tree[0, 1], 6: mk.tree[0, 6]}, proof, 8, root))
+
+    def test_save_open(self):
+        """Tests save and open"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tree.mk")
+            self.mk.add_node(None, (0, 7))
+            self.mk.generate_tree()
+            self.mk.save(path)
+            for mmap in (True, False):
+                mk = merkle_tree.MerkleTree.open(path, mmap=mmap)
+                self.assertEqual(8, mk.n_leaves)
+                self.assertEqual(list(self.mk.tree.items()), list(mk.tree.items()))
+                self.assertEqual(self.mk.get_authentification_path_hashes(3), mk.get_authentification_path_hashes(3))
+                mk.add_node("again", (0, 7))
+                mk.generate_tree()
+                self.assertNotEqual(self.mk.get_root(), mk.get_root())
+                del mk
+            self.assertEqual(self.mk.get_root(), merkle_tree.MerkleTree.open(path).get_root())
+
+            mk = merkle_tree.MerkleTree(n_leaves=1024)
+            mk.add_leaves(str(i) for i in range(1024))
+            mk.generate_tree()
+            mk.save(path)
+            mapped = merkle_tree.MerkleTree.open(path, mmap=True)
+            mapped.save(path)
+            self.assertEqual(mk.get_root(), merkle_tree.MerkleTree.open(path).get_root())
+            self.assertEqual(mk.get_root(), mapped.get_root())
+            self.mk.save(path)
+            self.assertEqual(mk.get_root(), mapped.get_root())
+            self.assertEqual(self.mk.get_root(), merkle_tree.MerkleTree.open(path).get_root())
+            self.assertEqual([], [i for i in os.listdir(directory) if i != "tree.mk"])
+            del mapped
+
+            self.mk.add_node("test", (0, 0))
+            self.assertRaises(ValueError, self.mk.save, path)
+            with open(path, 'wb') as f:
+                f.write(bytes(64))
+            self.assertRaises(ValueError, merkle_tree.MerkleTree.open, path)
+            with open(path, 'wb') as f:
+                f.write(merkle_tree.FILE_MAGIC)
+            self.assertRaises(ValueError, merkle_tree.MerkleTree.open, path)
+            with open(path, 'wb') as f:
+                f.write(merkle_tree.FILE_HEADER.pack(merkle_tree.FILE_MAGIC, 8, 0, b"sha256"))
+            self.assertRaises(ValueError, merkle_tree.MerkleTree.open, path)
+
+    def test_hash_function(self):
+        """Tests trees with another hash function, built, verified, saved and opened"""
+        blake2b = hashlib.blake2b
+        for hash_function, size in (('blake2b', 32), ('blake2b', 20)):
+            mk = merkle_tree.MerkleTree(n_leaves=4, hash_function=merkle_tree.get_hash_function(hash_function, size))
+            mk.add_leaves(["a", "b", "c"])
+            mk.add_node("d", (0, 3))
+            mk.generate_tree()
+            leaves = [blake2b(i, digest_size=size).digest() for i in (b"a", b"b", b"c", b"d")]
+            root = blake2b(blake2b(leaves[0] + leaves[1], digest_size=size).digest() +
+                           blake2b(leaves[2] + leaves[3], digest_size=size).digest(), digest_size=size).digest()
+            self.assertEqual(root, mk.get_root())
+            path = mk.get_authentification_path_hashes(2)
+            self.assertTrue(mk.verify_auth_path(leaves[2], 2, path, root, mk.hash_function))
+            self.assertFalse(mk.verify_auth_path(leaves[2], 2, path, root))
+            self.assertEqual([True], mk.verify_auth_paths([(leaves[2], 2, path)], root, mk.hash_function))
+            self.assertTrue(mk.verify_multiproof({1: leaves[1]}, mk.get_multiproof_hashes([1]), 4, root, mk.hash_function))
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "tree.mk")
+                mk.save(path)
+                opened = merkle_tree.MerkleTree.open(path)
+                self.assertEqual(mk.hash_function, opened.hash_function)
+                self.assertEqual(list(mk.tree.items()), list(opened.tree.items()))
+
+    def test_from_file(self):
+        """Tests from_file"""
+        data = os.urandom(5000)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "data")
+            with open(path, 'wb') as f:
+                f.write(data)
+            mk = merkle_tree.MerkleTree(n_leaves=8)
+            mk.add_leaves([data[i:i + 1000] for i in range(0, len(data), 1000)] + [b""] * 3)
+            mk.generate_tree()
+            for mmap in (True, False):
+                self.assertEqual(mk.get_root(), merkle_tree.MerkleTree.from_file(path, 1000, mmap=mmap).get_root())
+            mk = merkle_tree.MerkleTree(n_leaves=8)
+            with open(path, 'rb') as f:
+                mk.add_node(f, (0, 0))
+            self.assertEqual(hashlib.sha256(data).digest(), mk.tree[0, 0])
+
     def test_get_brother_node_position(self):
         """Tests get_brother_node_position"""
         sib1 = (0,2)
@@ -110,3 +298,35 @@ class merkle_tree_test(unittest.TestCase):
         path = [(0,7),(1,2),(2,0)]
         path_hashes = [self.mk.tree[i] for i in path]
         self.assertEqual(path_hashes, self.mk.get_authentification_path_hashes(leaf_index))
+
+
+class node_storage_test(unittest.TestCase):
+
+    """Tests the NodeStorage methods"""
+
+    def setUp(self):
+        """Initialization"""
+        self.store = merkle_tree.NodeStorage(n_leaves=8)
+
+    def test_heap_index(self):
+        """Tests heap_index and position"""
+        self.assertEqual(1, self.store.heap_index((3, 0)))
+        self.assertEqual(8, self.store.heap_index((0, 0)))
+        self.assertEqual(15, self.store.heap_index((0, 7)))
+        self.assertEqual((1, 2), self.store.position(self.store.heap_index((1, 2))))
+        self.assertRaises(KeyError, self.store.heap_index, (0, 8))
+        self.assertRaises(KeyError, self.store.heap_index, (4, 0))
+        self.assertRaises(KeyError, self.store.heap_index, (-1, 0))
+        self.assertNotIn((-1, 0), self.store)
+
+    def test_set_get(self):
+        """Tests set and get"""
+        value = hashlib.sha256(b"test").digest()
+        self.assertIsNone(self.store[0, 5])
+        self.store[0, 5] = value
+        self.assertEqual(value, self.store[0, 5])
+        self.assertIsInstance(self.store[0, 5], memoryview)
+        self.assertEqual(value, self.store.buffer[13 * 32:14 * 32])
+        self.store[0, 5] = None
+        self.assertIsNone(self.store[0, 5])
+        self.assertNotIn((0, 5), self.store)
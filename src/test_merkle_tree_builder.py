@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for streaming Merkle root computation
+  Created:  18/10/2026
+"""
+
+import merkle_tree
+import merkle_tree_builder
+import unittest
+import hashlib
+
+
+class merkle_tree_builder_test(unittest.TestCase):
+
+    """Tests the MerkleTreeBuilder methods"""
+
+    def test_power_of_two(self):
+        """Tests a power of two of leaves against MerkleTree"""
+        for n_leaves in (1, 2, 8, 64):
+            mk = merkle_tree.MerkleTree(n_leaves=n_leaves)
+            mk.add_leaves(str(i) for i in range(n_leaves))
+            mk.generate_tree()
+            self.assertEqual(mk.get_root(), merkle_tree_builder.streaming_root(str(i) for i in range(n_leaves)))
+
+    def test_promotion(self):
+        """Tests that a node without a brother is promoted"""
+        a, b, c = (hashlib.sha256(i.encode('utf-8')).digest() for i in ("a", "b", "c"))
+        root = hashlib.sha256(hashlib.sha256(a + b).digest() + c).digest()
+        builder = merkle_tree_builder.MerkleTreeBuilder()
+        builder.add_leaves(["a", "b"])
+        builder.add_leaf(c, hashed=True)
+        self.assertEqual(3, builder.n_leaves)
+        self.assertEqual(root, builder.get_root())
+        self.assertEqual(2, len([i for i in builder.pending if i is not None]))
+
+    def test_empty(self):
+        """Tests get_root without leaves"""
+        self.assertRaises(ValueError, merkle_tree_builder.streaming_root, iter(()))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for socket message framing
+  Created:  18/10/2026
+"""
+
+import socket
+import socket_client_server
+import threading
+import unittest
+
+
+class socket_framing_test(unittest.TestCase):
+
+    """Tests the message framing functions"""
+
+    def setUp(self):
+        self.a, self.b = socket.socketpair()
+
+    def tearDown(self):
+        self.a.close()
+        self.b.close()
+
+    def test_messages(self):
+        """Tests many large messages on one connection"""
+        messages = [bytes([i]) * (i * 20000) for i in range(1, 6)] + [b"", "text"]
+
+        def send():
+            for message in messages:
+                socket_client_server.send_message(self.a, message)
+            self.a.shutdown(socket.SHUT_WR)
+
+        thread = threading.Thread(target=send)
+        thread.start()
+        received = []
+        message = socket_client_server.receive_message(self.b)
+        while message is not None:
+            received.append(message)
+            message = socket_client_server.receive_message(self.b)
+        thread.join()
+        self.assertEqual(messages[:-1] + [b"text"], received)
+
+    def test_truncated(self):
+        """Tests a connection closed inside a message"""
+        self.a.sendall(socket_client_server.FRAME_HEADER.pack(10) + b"abc")
+        self.a.shutdown(socket.SHUT_WR)
+        self.assertRaises(ConnectionError, socket_client_server.receive_message, self.b)
+
+    def test_too_large(self):
+        """Tests the message size limit"""
+        socket_client_server.send_message(self.a, b"abcdef")
+        self.assertRaises(ValueError, socket_client_server.receive_message, self.b, 5)
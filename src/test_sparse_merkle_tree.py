@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the sparse Merkle tree
+  Created:  18/10/2026
+"""
+
+import hashlib
+import merkle_tree
+import sparse_merkle_tree
+import unittest
+
+
+class sparse_merkle_tree_test(unittest.TestCase):
+
+    """Tests the SparseMerkleTree methods"""
+
+    def setUp(self):
+        """Initialization"""
+        self.smt = sparse_merkle_tree.SparseMerkleTree()
+        self.keys = [hashlib.sha256(str(i).encode()).digest() for i in range(20)]
+        self.smt.update({key: str(i) for i, key in enumerate(self.keys)})
+
+    def test_small_tree(self):
+        """Tests a full key space against MerkleTree"""
+        smt = sparse_merkle_tree.SparseMerkleTree(depth=3)
+        mk = merkle_tree.MerkleTree(n_leaves=8)
+        mk.add_leaves(bytes(32 * 8), hashed=True)
+        for key in (1, 6):
+            smt.set(key, str(key))
+            mk.add_node(str(key), (0, key))
+        mk.generate_tree()
+        self.assertEqual(mk.get_root(), smt.get_root())
+        self.assertEqual(mk.get_authentification_path_hashes(5), smt.get_authentification_path_hashes(5))
+        self.assertEqual(5, sum(len(level) for level in smt.levels[1:]))  # Two nodes per level then the root.
+        self.assertRaises(KeyError, smt.set, 8, "8")
+
+    def test_update(self):
+        """Tests update, set and delete"""
+        self.assertEqual(20, len(self.smt))
+        self.assertIn(self.keys[3], self.smt)
+        self.assertEqual(hashlib.sha256(b"3").digest(), self.smt.get(self.keys[3]))
+        self.assertLessEqual(sum(len(level) for level in self.smt.levels), 20 * 257)
+        smt = sparse_merkle_tree.SparseMerkleTree()
+        for i, key in enumerate(self.keys):
+            smt.set(key, hashlib.sha256(str(i).encode()).digest(), hashed=True)
+        self.assertEqual(self.smt.get_root(), smt.get_root())
+        for key in self.keys:
+            smt.delete(key)
+        self.assertEqual(bytearray(smt.defaults[-1]), smt.get_root())
+        self.assertEqual(0, sum(len(level) for level in smt.levels))
+
+    def test_proofs(self):
+        """Tests membership and non-membership proofs"""
+        root = self.smt.get_root()
+        path = self.smt.get_authentification_path_hashes(self.keys[7])
+        self.assertEqual(256, len(path))
+        self.assertTrue(self.smt.verify_membership(self.keys[7], "7", path, root))
+        self.assertFalse(self.smt.verify_membership(self.keys[7], "8", path, root))
+        self.assertFalse(self.smt.verify_non_membership(self.keys[7], path, root))
+        absent = hashlib.sha256(b"absent").digest()
+        path = self.smt.get_authentification_path_hashes(absent)
+        self.assertTrue(self.smt.verify_non_membership(absent, path, root))
+        self.assertFalse(self.smt.verify_membership(absent, "absent", path, root))
+        self.assertTrue(merkle_tree.MerkleTree.verify_auth_path(bytes(32), int.from_bytes(absent, 'big'), path, root))
+
+
+if __name__ == '__main__':
+    unittest.main()
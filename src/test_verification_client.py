@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the verification client
+  Created:  18/10/2026
+"""
+
+import asyncio
+import benchmark_wire_format
+import unittest
+import verification_client
+import verification_server
+import wire_format
+from concurrent.futures import ThreadPoolExecutor
+
+
+class verification_client_test(unittest.TestCase):
+
+    """Tests the verification clients"""
+
+    def setUp(self):
+        """Initialization"""
+        n_leaves, index, root, msg, signature = benchmark_wire_format.sample_signature(4)
+        self.valid = wire_format.encode_signature(n_leaves, index, root, msg, signature)
+        self.invalid = wire_format.encode_signature(n_leaves, index, root, "other", signature)
+
+    async def serve(self, test):
+        server = verification_server.VerificationServer(port=0, executor=ThreadPoolExecutor(2))
+        await server.start()
+        try:
+            return await test(server.port)
+        finally:
+            await server.close()
+
+    def test_pipelining(self):
+        """Tests many pipelined requests over a pool of connections"""
+        async def test(port):
+            async with verification_client.VerificationClient(port=port, size=2) as client:
+                futures = [client.submit(self.valid if i % 3 else self.invalid) for i in range(30)]
+                self.assertEqual(2, len(client.connections))
+                self.assertTrue(all(len(i.pending) == 15 for i in client.connections))
+                results = await asyncio.gather(*futures)
+                self.assertTrue(await client.verify(self.valid))
+                self.assertEqual([True, False], await client.verify_many([self.valid, self.invalid]))
+                return results
+
+        results = asyncio.run(self.serve(test))
+        self.assertEqual([bool(i % 3) for i in range(30)], results)
+
+    def test_dead_connection(self):
+        """Tests that a lost connection leaves the pool and is replaced"""
+        async def test(port):
+            async with verification_client.VerificationClient(port=port, size=2) as client:
+                dead = client.connections[0]
+                dead.writer.transport.abort()
+                await dead.task
+                self.assertTrue(dead.closed)
+                self.assertNotIn(dead, client.connections)
+                with self.assertRaises(ConnectionError):
+                    dead.send(0, self.valid, asyncio.get_running_loop().create_future())
+                self.assertTrue(await client.verify(self.valid))
+                self.assertEqual(2, len(client.connections))
+                return await client.verify_many([self.valid, self.invalid])
+
+        self.assertEqual([True, False], asyncio.run(self.serve(test)))
+
+    def test_blocking(self):
+        """Tests the blocking client"""
+        async def test(port):
+            loop = asyncio.get_running_loop()
+
+            def run():
+                client = verification_client.BlockingVerificationClient(port=port, size=2)
+                try:
+                    return client.submit(self.valid).result(), client.verify_many([self.invalid, self.valid])
+                finally:
+                    client.close()
+
+            return await loop.run_in_executor(None, run)
+
+        self.assertEqual((True, [False, True]), asyncio.run(self.serve(test)))
+
+    def test_connection_lost(self):
+        """Tests pending requests when the server closes the connection"""
+        async def test():
+            async def handle(reader, writer):
+                await reader.read(1)
+                writer.close()
+
+            server = await asyncio.start_server(handle, "localhost", 0)
+            client = verification_client.VerificationClient(port=server.sockets[0].getsockname()[1], size=1)
+            await client.connect()
+            future = client.submit(self.valid)
+            with self.assertRaises(ConnectionError):
+                await future
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(test())
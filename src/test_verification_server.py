@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the asyncio verification server
+  Created:  18/10/2026
+"""
+
+import asyncio
+import benchmark_verification_server
+import benchmark_wire_format
+import unittest
+import unittest.mock
+import verification_client
+import verification_server
+import wire_format
+from concurrent.futures import ThreadPoolExecutor
+
+
+class verification_server_test(unittest.TestCase):
+
+    """Tests the verification server"""
+
+    def setUp(self):
+        """Initialization"""
+        n_leaves, index, root, msg, signature = benchmark_wire_format.sample_signature(4)
+        self.root = root
+        self.valid = wire_format.encode_signature(n_leaves, index, root, msg, signature)
+        self.invalid = wire_format.encode_signature(n_leaves, index, root, "other", signature)
+
+    def test_verify_signature(self):
+        """Tests verify_signature"""
+        self.assertTrue(verification_server.verify_signature(self.valid))
+        self.assertFalse(verification_server.verify_signature(self.invalid))
+        self.assertFalse(verification_server.verify_signature(self.valid[:-1]))
+        self.assertTrue(verification_server.verify_signature(self.valid, frozenset([bytes(self.root)])))
+        self.assertFalse(verification_server.verify_signature(self.valid, frozenset([bytes(32)])))
+
+    def test_server(self):
+        """Tests concurrent pipelined connections with backpressure"""
+        async def run():
+            server = verification_server.VerificationServer(port=0, max_pending=3, max_in_flight=2,
+                                                            executor=ThreadPoolExecutor(2))
+            await server.start()
+            try:
+                return await asyncio.gather(
+                    benchmark_verification_server.load_test(server.host, server.port, self.valid, 3, 5),
+                    benchmark_verification_server.load_test(server.host, server.port, self.invalid, 2, 5))
+            finally:
+                await server.close()
+
+        (_, accepted), (_, rejected) = asyncio.run(run())
+        self.assertEqual(15, accepted)
+        self.assertEqual(0, rejected)
+
+    def test_executor_failure(self):
+        """Tests that a request whose verification cannot run is rejected"""
+        async def run():
+            executor = ThreadPoolExecutor(1)
+            server = verification_server.VerificationServer(port=0, executor=executor)
+            await server.start()
+            executor.shutdown()
+            try:
+                async with verification_client.VerificationClient(port=server.port, size=1) as client:
+                    return await asyncio.wait_for(client.verify_many([self.valid, self.valid]), 5)
+            finally:
+                await server.close()
+
+        self.assertEqual([False, False], asyncio.run(run()))
+
+    def test_verification_error(self):
+        """Tests that an unexpected verification error is logged and closes the connection"""
+        async def run():
+            server = verification_server.VerificationServer(port=0, executor=ThreadPoolExecutor(1))
+            await server.start()
+            try:
+                async with verification_client.VerificationClient(port=server.port, size=1) as client:
+                    with self.assertRaises(ConnectionError):
+                        await asyncio.wait_for(client.verify(self.valid), 5)
+            finally:
+                await server.close()
+
+        with unittest.mock.patch.object(verification_server, 'verify_signature', side_effect=KeyError("bug")):
+            with self.assertLogs(verification_server.logger, 'ERROR'):
+                asyncio.run(run())
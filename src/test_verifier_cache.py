@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the verifier cache
+  Created:  18/10/2026
+"""
+
+import merkle_tree
+import sys
+import unittest
+import verifier_cache
+from concurrent.futures import ThreadPoolExecutor
+
+
+class verifier_cache_test(unittest.TestCase):
+
+    """Tests the VerifierCache methods"""
+
+    def setUp(self):
+        """Initialization"""
+        self.mk = merkle_tree.MerkleTree(n_leaves=8)
+        self.mk.add_leaves(str(i) for i in range(8))
+        self.mk.generate_tree()
+        self.root = self.mk.get_root()
+        self.cache = verifier_cache.VerifierCache()
+
+    def proof(self, index):
+        return self.mk.tree[0, index], index, self.mk.get_authentification_path_hashes(index)
+
+    def test_verify_auth_path(self):
+        """Tests verify_auth_path with and without cached nodes"""
+        self.assertTrue(self.cache.verify_auth_path(*self.proof(0), self.root))
+        self.assertEqual((0, 1), (self.cache.hits, self.cache.misses))
+        self.assertEqual(6, len(self.cache.nodes))
+        self.assertTrue(self.cache.verify_auth_path(*self.proof(1), self.root))
+        self.assertTrue(self.cache.verify_auth_path(*self.proof(3), self.root))
+        self.assertEqual((2, 1), (self.cache.hits, self.cache.misses))
+
+        self.assertTrue(self.cache.verify_auth_path(self.mk.tree[0, 2], 2, [bytes(32)] * 3, self.root))  # Authenticated leaf.
+        leaf, index, path = self.proof(6)
+        self.assertFalse(self.cache.verify_auth_path(leaf, index, [bytes(32)] + path[1:], self.root))
+        self.assertFalse(self.cache.verify_auth_path(self.mk.tree[0, 5], 1, self.proof(1)[2], self.root))
+        self.assertFalse(self.cache.verify_auth_path(*self.proof(4), bytes(32)))
+        self.assertTrue(self.cache.verify_auth_path(*self.proof(4), self.root))
+
+    def test_eviction(self):
+        """Tests the size limit"""
+        cache = verifier_cache.VerifierCache(max_size=4)
+        for i in range(8):
+            self.assertTrue(cache.verify_auth_path(*self.proof(i), self.root))
+            self.assertLessEqual(len(cache.nodes), 4)
+
+    def test_threads(self):
+        """Tests a small cache shared between threads"""
+        cache = verifier_cache.VerifierCache(max_size=8)
+        proofs = [self.proof(i % 8) for i in range(20000)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads inside the cache updates.
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(lambda proof: cache.verify_auth_path(*proof, self.root), proofs))
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual([True] * 20000, results)
+        self.assertLessEqual(len(cache.nodes), 8)
+        self.assertEqual(20000, cache.hits + cache.misses)
+
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for Winternitz signature class
+  Created:  18/10/2026
+"""
+
+import hash_functions
+import winternitz
+import unittest
+import hashlib
+
+
+class winternitz_signature_test(unittest.TestCase):
+
+    """Tests the winternitz signature methods"""
+
+    def setUp(self):
+        self.ws = winternitz.WinternitzSignature(w=16)
+
+    def test_chain_lengths(self):
+        """Tests chain_lengths"""
+        self.assertEqual((64, 3), winternitz.chain_lengths(16))
+        self.assertEqual((128, 5), winternitz.chain_lengths(4))
+        self.assertEqual((32, 2), winternitz.chain_lengths(256))
+        self.assertRaises(ValueError, winternitz.chain_lengths, 8)
+
+    def test_generate_public_key(self):
+        """Tests generate_public_key"""
+        self.assertEqual(67, len(self.ws.private_key))
+        x = bytes(self.ws.private_key[10])
+        for _ in range(15):
+            x = hashlib.sha256(x).digest()
+        self.assertEqual(x, self.ws.public_key[10])
+        self.assertEqual(67 * 32, len(self.ws.get_key('public', True)))
+
+    def test_decatenate_key(self):
+        """Tests decatenate_key"""
+        self.assertEqual(self.ws.decatenate_key(self.ws.concatenate_key(self.ws.public_key)), self.ws.public_key)
+        self.assertRaises(ValueError, self.ws.decatenate_key, bytearray(33))
+
+    def test_message_digits(self):
+        """Tests message_digits"""
+        digits = self.ws.message_digits('abc', 16)
+        self.assertEqual(hashlib.sha256(b'abc').hexdigest(), ''.join('{:x}'.format(i) for i in digits[:64]))
+        self.assertEqual(sum(15 - i for i in digits[:64]), int(''.join('{:x}'.format(i) for i in digits[64:]), 16))
+
+    def test_verify(self):
+        """Tests verify"""
+        msg = 'Ceci est un message test'
+        for w in (4, 16, 256):
+            ws = winternitz.WinternitzSignature(w=w)
+            signature = ws.sign(msg)
+            self.assertTrue(ws.verify(msg, signature, ws.public_key, w=w))
+            self.assertTrue(ws.verify(msg, ws.concatenate_key(signature), ws.get_key('public', True), w=w))
+            self.assertFalse(ws.verify('Ceci est un autre message test', signature, ws.public_key, w=w))
+            self.assertFalse(ws.verify(msg, signature[:-1], ws.public_key, w=w))
+            self.assertRaises(ValueError, ws.sign, msg)
+
+    def test_hash_function(self):
+        """Tests keys with another hash function"""
+        ws = winternitz.WinternitzSignature(hash_function='sha3_256')
+        x = bytes(ws.private_key[10])
+        for _ in range(15):
+            x = hashlib.sha3_256(x).digest()
+        self.assertEqual(x, ws.public_key[10])
+        signature = ws.sign('abc')
+        self.assertTrue(ws.verify('abc', signature, ws.public_key, hash_function='sha3_256'))
+        self.assertFalse(ws.verify('abc', signature, ws.public_key))
+        self.assertRaises(ValueError, winternitz.WinternitzSignature,
+                          hash_function=hash_functions.get_hash_function('blake2b', 64))
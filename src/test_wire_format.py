@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Tests for the Merkle signature wire format
+  Created:  18/10/2026
+"""
+
+import lamport
+import merkle_tree
+import wire_format
+import unittest
+
+
+class wire_format_test(unittest.TestCase):
+
+    """Tests the wire format functions"""
+
+    def setUp(self):
+        """Initialization"""
+        self.keys = lamport.LamportSignature.generate_keys(4)
+        self.mk = merkle_tree.MerkleTree(n_leaves=4)
+        self.mk.add_leaves([i.get_key('public', True) for i in self.keys])
+        self.mk.generate_tree()
+        self.signature = [self.keys[2].sign("test"), self.keys[2].get_key('public', True),
+                          self.mk.get_authentification_path_hashes(2)]
+
+    def test_encode_decode(self):
+        """Tests encode_signature and decode_signature"""
+        data = wire_format.encode_signature(4, 2, self.mk.get_root(), "test", self.signature)
+        self.assertEqual(wire_format.HEADER.size + 32 + 8192 + 16384 + 2 * 32 + 4, len(data))
+        n_leaves, index, root, msg, (sig_prime, public_key, auth) = wire_format.decode_signature(data)
+        self.assertEqual((4, 2, b"test"), (n_leaves, index, msg))
+        self.assertIsInstance(msg, memoryview)
+        self.assertIsInstance(sig_prime, memoryview)
+        self.assertEqual(self.mk.get_root(), root)
+        self.assertTrue(lamport.LamportSignature.verify(msg, sig_prime, public_key))
+        self.assertTrue(merkle_tree.MerkleTree.verify_auth_path(merkle_tree.MerkleTree.hash(public_key), index, auth, root))
+
+    def test_binary_message(self):
+        """Tests a message which is not UTF-8"""
+        key = lamport.LamportSignature.generate_keys(1)[0]
+        signature = [key.sign(b"\xff\x00binary"), key.get_key('public', True), self.signature[2]]
+        data = wire_format.encode_signature(4, 2, self.mk.get_root(), b"\xff\x00binary", signature)
+        _, _, _, msg, (sig_prime, public_key, _) = wire_format.decode_signature(data)
+        self.assertEqual(b"\xff\x00binary", msg)
+        self.assertTrue(lamport.LamportSignature.verify(msg, sig_prime, public_key))
+        self.assertFalse(lamport.LamportSignature.verify(b"\xff\x00binarz", sig_prime, public_key))
+
+    def test_decode_errors(self):
+        """Tests decode_signature with malformed data"""
+        data = wire_format.encode_signature(4, 2, self.mk.get_root(), "test", self.signature)
+        self.assertRaises(ValueError, wire_format.decode_signature, data[:-1])
+        self.assertRaises(ValueError, wire_format.decode_signature, data[:10])
+        self.assertRaises(ValueError, wire_format.decode_signature, b"XXXX" + data[4:])
+        self.assertRaises(ValueError, wire_format.encode_signature, 8, 2, self.mk.get_root(), "test", self.signature)
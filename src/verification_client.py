@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Connection-pooled, pipelined client of the verification server.
+  Created:  18/10/2026
+"""
+
+import asyncio
+import itertools
+import struct
+import threading
+from socket_client_server import FRAME_HEADER
+from verification_server import REQUEST_HEADER, RESPONSE
+
+
+class Connection:
+    """Persistent connection to the verification server.
+
+    Attributes:
+        reader (asyncio.StreamReader): Connection reader.
+        writer (asyncio.StreamWriter): Connection writer.
+        pending (dict): Request id -> future of the requests waiting for their response.
+        closed (boolean): Connection lost or closed, no request can be sent anymore.
+        on_close (None/callable): Called with the connection once it is closed.
+        task (asyncio.Task): Task dispatching the responses to the futures.
+
+    """
+
+    def __init__(self, reader, writer, on_close=None):
+        """Connection object constructor.
+
+        Args:
+            reader (asyncio.StreamReader): Connection reader.
+            writer (asyncio.StreamWriter): Connection writer.
+            on_close (callable): Called with the connection once it is closed.
+
+        """
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}
+        self.closed = False
+        self.on_close = on_close
+        self.task = asyncio.ensure_future(self.dispatch())
+
+    def send(self, request_id, data, future):
+        """Send a request without waiting for its response.
+
+        Args:
+            request_id (int): Request id.
+            data (bytes-like): Encoded signature.
+            future (asyncio.Future): Future set to the result of the verification.
+
+        """
+        if self.closed:
+            raise ConnectionError("Connection to the verification server closed.")
+        self.pending[request_id] = future
+        self.writer.write(FRAME_HEADER.pack(REQUEST_HEADER.size + len(data)) + REQUEST_HEADER.pack(request_id))
+        self.writer.write(data)
+
+    async def dispatch(self):
+        """Set the futures of the requests as their responses arrive, until the connection is lost or closed."""
+        try:
+            while True:
+                size, = FRAME_HEADER.unpack(await self.reader.readexactly(FRAME_HEADER.size))
+                if size != RESPONSE.size:
+                    raise ValueError("Wrong response size.")
+                request_id, result = RESPONSE.unpack(await self.reader.readexactly(size))
+                future = self.pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(bool(result))
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, struct.error) as e:
+            error = ConnectionError("Connection to the verification server lost.")
+            error.__cause__ = e
+        except asyncio.CancelledError:
+            error = ConnectionError("Client closed.")
+        self.closed = True
+        self.writer.close()
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+        if self.on_close is not None:
+            self.on_close(self)
+
+    async def close(self):
+        """Close the connection, the requests still pending fail."""
+        self.writer.close()
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class VerificationClient:
+    """Asyncio client keeping a pool of connections to the verification server.
+
+    Requests are pipelined: submit() writes the request on the connection with the fewest
+    pending requests and returns a future, so many signatures share a connection and no
+    TCP handshake is paid per message. A lost connection leaves the pool, and verify() and
+    verify_many() open new ones to refill it.
+
+    Attributes:
+        host (str): Server address.
+        port (int): Server port.
+        size (int): Number of connections.
+        connections (list): Open connections.
+
+    """
+
+    def __init__(self, host="localhost", port=12800, size=4):
+        """VerificationClient object constructor.
+
+        Args:
+            host (str): Server address.
+            port (int): Server port.
+            size (int): Number of connections.
+
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self.connections = []
+        self.request_ids = itertools.count()
+
+    async def connect(self):
+        """Open the connections."""
+        for _ in range(self.size - len(self.connections)):
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            self.connections.append(Connection(reader, writer, self.remove))
+
+    async def reconnect(self):
+        """Replace the lost connections, failing only if none is left."""
+        if len(self.connections) < self.size:
+            try:
+                await self.connect()
+            except OSError:
+                if not self.connections:
+                    raise
+
+    def remove(self, connection):
+        """Take a closed connection out of the pool."""
+        if connection in self.connections:
+            self.connections.remove(connection)
+
+    def send(self, data):
+        """Send a signature to verify on the connection with the fewest pending requests.
+
+        Args:
+            data (bytes-like): Encoded signature, see wire_format.
+
+        Returns:
+            (tuple): Connection the request was written to, future set to True if the
+                signature is accepted otherwise False.
+
+        """
+        if not self.connections:
+            raise ConnectionError("Client not connected.")
+        future = asyncio.get_running_loop().create_future()
+        connection = min(self.connections, key=lambda i: len(i.pending))
+        connection.send(next(self.request_ids), data, future)
+        return connection, future
+
+    def submit(self, data):
+        """Send a signature to verify.
+
+        Args:
+            data (bytes-like): Encoded signature, see wire_format.
+
+        Returns:
+            (asyncio.Future): Future set to True if the signature is accepted otherwise False.
+
+        """
+        return self.send(data)[1]
+
+    async def verify(self, data):
+        """Verify a signature.
+
+        Args:
+            data (bytes-like): Encoded signature, see wire_format.
+
+        Returns:
+            (boolean): True if the signature is accepted otherwise False.
+
+        """
+        await self.reconnect()
+        connection, future = self.send(data)
+        await connection.writer.drain()
+        return await future
+
+    async def verify_many(self, datas):
+        """Verify many signatures, pipelined over the connections.
+
+        Args:
+            datas (iterable): Encoded signatures.
+
+        Returns:
+            (list): True or False for each signature.
+
+        """
+        await self.reconnect()
+        sent = [self.send(data) for data in datas]
+        await asyncio.gather(*[i.writer.drain() for i in set(connection for connection, _ in sent)])
+        return await asyncio.gather(*[future for _, future in sent])
+
+    async def close(self):
+        """Close the connections."""
+        connections, self.connections = self.connections, []
+        await asyncio.gather(*[i.close() for i in connections])
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+class BlockingVerificationClient:
+    """Blocking facade of VerificationClient, running its event loop in a thread.
+
+    Attributes:
+        client (VerificationClient): Asyncio client.
+        loop (asyncio.AbstractEventLoop): Event loop of the client thread.
+
+    """
+
+    def __init__(self, host="localhost", port=12800, size=4):
+        """BlockingVerificationClient object constructor, opens the connections.
+
+        Args:
+            host (str): Server address.
+            port (int): Server port.
+            size (int): Number of connections.
+
+        """
+        self.client = VerificationClient(host, port, size)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.call(self.client.connect())
+
+    def call(self, coroutine):
+        """Run a coroutine in the client thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def submit(self, data):
+        """Send a signature to verify.
+
+        Args:
+            data (bytes-like): Encoded signature, see wire_format.
+
+        Returns:
+            (concurrent.futures.Future): Future set to True if the signature is accepted otherwise False.
+
+        """
+        return asyncio.run_coroutine_threadsafe(self.client.verify(data), self.loop)
+
+    def verify_many(self, datas):
+        """Verify many signatures, see VerificationClient.verify_many()."""
+        return self.call(self.client.verify_many(list(datas)))
+
+    def close(self):
+        """Close the connections and stop the client thread."""
+        self.call(self.client.close())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Concurrent asyncio Merkle signature verification server.
+  Created:  18/10/2026
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import struct
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from lamport import LamportSignature
+from merkle_tree import MerkleTree
+from socket_client_server import FRAME_HEADER, MAX_MESSAGE_SIZE
+from verifier_cache import VerifierCache
+from wire_format import decode_signature
+
+
+REQUEST_HEADER = struct.Struct('>Q')  # Request id, followed by the encoded signature.
+RESPONSE = struct.Struct('>QB')  # Request id, 1 if the signature is accepted otherwise 0.
+logger = logging.getLogger(__name__)
+cache = VerifierCache()  # Nodes authenticated by the current process, shared by its threads.
+
+
+def verify_signature(data, trusted_roots=None):
+    """Verify an encoded Merkle signature, see wire_format.
+
+    Args:
+        data (bytes-like): Encoded signature.
+        trusted_roots (None/frozenset): Roots accepted, any root if None.
+
+    Returns:
+        (boolean): True if the signature is valid otherwise False.
+
+    """
+    try:
+        n_leaves, index, root, msg, (sig_prime, public_key, auth) = decode_signature(data)
+    except ValueError:
+        return False
+    if trusted_roots is not None and bytes(root) not in trusted_roots:
+        return False
+    if not LamportSignature.verify(msg, sig_prime, public_key):
+        return False
+    return cache.verify_auth_path(MerkleTree.hash(public_key), index, auth, root)
+
+
+class VerificationServer:
+    """Verification server.
+
+    Each connection carries framed requests (request id, encoded signature) and gets back a
+    framed response (request id, accepted) per request, in completion order. Verifications
+    run in a process pool. A connection stops being read while it has 'max_in_flight'
+    requests being verified, and no more request is handed to the pool while 'max_pending'
+    requests are being verified, so slow verification pushes back on the clients. A request
+    the pool cannot run, once broken or shut down, is rejected. Any other error is logged
+    and closes the connection, failing its pending requests on the client side.
+
+    Attributes:
+        host (str): Listening address.
+        port (int): Listening port, the one chosen by the system once started if 0.
+        executor (Executor): Pool running the verifications.
+        trusted_roots (None/frozenset): Roots accepted, any root if None.
+        max_in_flight (int): Requests being verified per connection.
+        pending (asyncio.Semaphore): Requests being verified over all connections.
+        verified (int): Number of requests answered.
+
+    """
+
+    def __init__(self, host="localhost", port=12800, workers=None, max_pending=1024, max_in_flight=64,
+                 trusted_roots=None, executor=None):
+        """VerificationServer object constructor.
+
+        Args:
+            host (str): Listening address.
+            port (int): Listening port, 0 to let the system choose.
+            workers (int): Number of verification processes, one per core if None.
+            max_pending (int): Requests being verified over all connections.
+            max_in_flight (int): Requests being verified per connection.
+            trusted_roots (iterable): Roots accepted, any root if None.
+            executor (Executor): Pool running the verifications instead of a new process pool.
+
+        """
+        self.host = host
+        self.port = port
+        if executor is None:  # Spawned workers do not inherit the event loop nor the open sockets.
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        self.executor = executor
+        self.trusted_roots = None if trusted_roots is None else frozenset(bytes(i) for i in trusted_roots)
+        self.max_pending = max_pending
+        self.max_in_flight = max_in_flight
+        self.pending = None
+        self.server = None
+        self.connections = set()
+        self.verified = 0
+
+    async def start(self):
+        """Start listening."""
+        self.pending = asyncio.Semaphore(self.max_pending)
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Start listening and serve until cancelled."""
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """Stop listening, wait for the open connections to be closed by the clients and shut the pool down."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.connections:
+            await asyncio.wait(self.connections)
+        self.executor.shutdown()
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection until the client closes it.
+
+        Args:
+            reader (asyncio.StreamReader): Connection reader.
+            writer (asyncio.StreamWriter): Connection writer.
+
+        """
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        tasks = set()
+        connection = asyncio.current_task()
+        self.connections.add(connection)
+        try:
+            while True:
+                await in_flight.acquire()
+                try:
+                    size, = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+                    if size < REQUEST_HEADER.size or size > MAX_MESSAGE_SIZE:
+                        raise ValueError("Wrong request size.")
+                    data = await reader.readexactly(size)
+                except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                    in_flight.release()
+                    break
+                await self.pending.acquire()
+                task = asyncio.ensure_future(self.answer(data, writer, in_flight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        finally:
+            writer.close()
+            self.connections.discard(connection)
+
+    async def answer(self, data, writer, in_flight):
+        """Verify one request and send the response.
+
+        Args:
+            data (bytes): Request id and encoded signature.
+            writer (asyncio.StreamWriter): Connection writer.
+            in_flight (asyncio.Semaphore): Requests being verified on the connection.
+
+        """
+        request_id, = REQUEST_HEADER.unpack_from(data)
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, verify_signature,
+                                                data[REQUEST_HEADER.size:], self.trusted_roots)
+        except (BrokenExecutor, RuntimeError):  # Pool broken or shut down.
+            result = False
+        except Exception:
+            logger.exception("Verification of request %d failed.", request_id)
+            writer.close()
+            return
+        finally:
+            in_flight.release()
+            self.pending.release()
+        self.verified += 1
+        writer.write(FRAME_HEADER.pack(RESPONSE.size) + RESPONSE.pack(request_id, result))
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+
+def main():
+    server = VerificationServer(host="", port=12800)
+    print("Verification server listening on port {}".format(server.port))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Verifier-side cache of authenticated Merkle tree nodes.
+  Created:  18/10/2026
+"""
+
+import threading
+from collections import OrderedDict
+from hash_functions import get_hash_function
+
+
+class VerifierCache:
+    """LRU cache of the nodes already authenticated under a root.
+
+    Once a path has been checked up to a root, its nodes and their brothers are known to
+    belong to the tree of that root. A later path of the same tree only has to reach one of
+    them: it is accepted if it computes the same hash there and rejected otherwise. The
+    cache can be shared between threads, the hashes are computed outside of its lock.
+
+    Attributes:
+        max_size (int): Number of nodes kept.
+        nodes (OrderedDict): (root, path length, level, index) -> node hash, least recently used first.
+        hits (int): Number of paths cut short by the cache.
+        misses (int): Number of paths checked up to the root.
+        hash_function (HashFunction): Hash function of the trees.
+        lock (threading.Lock): Lock of 'nodes' and of the counters.
+
+    """
+
+    def __init__(self, max_size=2 ** 16, hash_function=None):
+        """VerifierCache object constructor.
+
+        Args:
+            max_size (int): Number of nodes kept.
+            hash_function (None/str/HashFunction): Hash function of the trees, see hash_functions.get_hash_function().
+
+        """
+        self.max_size = max_size
+        self.hash_function = get_hash_function(hash_function)
+        self.nodes = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def verify_auth_path(self, leaf_hash, index, path, root):
+        """Check an authentification path against a root, stopping at the first authenticated node.
+
+        Args:
+            leaf_hash (bytes-like): Hash of the leaf.
+            index (int): Leaf number (from 0 to n_leaves - 1).
+            path (list): [auth(0), ..., auth(n-1)], see MerkleTree.get_authentification_path_hashes().
+            root (bytes-like): Root hash.
+
+        Returns:
+            (boolean): True if the path leads from the leaf to the root otherwise False.
+
+        """
+        if not 0 <= index < 1 << len(path):
+            return False
+        root = bytes(root)
+        height = len(path)
+        node = bytes(leaf_hash)
+        digest = self.hash_function.digest
+        computed = []
+        for level in range(height + 1):
+            key = (root, height, level, index)
+            with self.lock:
+                known = self.nodes.get(key)
+                if known is not None:
+                    self.nodes.move_to_end(key)
+                    self.hits += 1
+                elif level == height:
+                    self.misses += 1
+            if known is not None:
+                result = known == node
+                break
+            if level == height:
+                result = node == root
+                break
+            brother = bytes(path[level])
+            computed.append((key, node))
+            computed.append(((root, height, level, index ^ 1), brother))
+            node = digest(b"".join((brother, node) if index & 1 else (node, brother)))
+            index >>= 1
+        if result:
+            with self.lock:
+                for key, value in computed:
+                    self.nodes[key] = value
+                    self.nodes.move_to_end(key)
+                while len(self.nodes) > self.max_size:
+                    self.nodes.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Forget every node."""
+        with self.lock:
+            self.nodes.clear()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Winternitz One-Time Signature Scheme (W-OTS) implementation.
+  Created:  18/10/2026
+"""
+
+from math import ceil, floor, log2
+from os import urandom
+from hash_functions import SHA256, get_hash_function
+
+
+def chain_lengths(w):
+    """Number of hash chains of the W-OTS keys.
+
+    Args:
+        w (int): Winternitz parameter, 4, 16 or 256.
+
+    Returns:
+        (tuple): Chains signing the message hash, chains signing the checksum.
+
+    """
+    if w not in (4, 16, 256):
+        raise ValueError("Wrong Winternitz parameter.")
+    len1 = ceil(256 / log2(w))
+    len2 = floor(log2(len1 * (w - 1)) / log2(w)) + 1
+    return len1, len2
+
+
+def hash_chain(value, steps, hash_function=SHA256):
+    """Apply the hash function 'steps' times.
+
+    Args:
+        value (bytes-like): Start of the chain, 256 bits.
+        steps (int): Number of hashes.
+        hash_function (HashFunction): Hash function of the chain.
+
+    Returns:
+        (bytearray): End of the chain, 256 bits.
+
+    """
+    value = bytes(value)
+    digest = hash_function.digest
+    for _ in range(steps):
+        value = digest(value)
+    return bytearray(value)
+
+
+class WinternitzSignature:
+    """Winternitz signature class.
+
+    Each 256-bit element of the private key is the start of a hash chain of w - 1 hashes,
+    whose end is the matching public key element. A message is signed by revealing, for
+    each base-w digit of its hash and of the checksum of the digits, the chain element at
+    the position of the digit.
+
+    Attributes:
+        w (int): Winternitz parameter, 4, 16 or 256.
+        hash_function (HashFunction): Hash function of the chains and of the messages.
+        private_key (list): Private key.
+        public_key (list): Public key.
+        used (boolean): Keys already used to sign a message.
+
+    """
+
+    def __init__(self, w=16, hash_function=None):
+        """WinternitzSignature object constructor
+
+        Args:
+            w (int): Winternitz parameter, a larger one gives smaller keys and more hashing.
+            hash_function (None/str/HashFunction): Hash function with 256-bit digests,
+                see hash_functions.get_hash_function().
+
+        """
+        self.w = w
+        self.hash_function = self.check_hash_function(hash_function)
+        self.private_key = self.generate_private_key(w)
+        self.public_key = self.generate_public_key()
+        self.used = False
+
+    @staticmethod
+    def generate_private_key(w):
+        """Generate a private key.
+
+        Args:
+            w (int): Winternitz parameter.
+
+        Returns:
+            (list): Private key, one 256-bit element per chain (67×256 bits for w = 16).
+
+        """
+        n_chains = sum(chain_lengths(w))
+        return WinternitzSignature.decatenate_key(bytearray(urandom(32 * n_chains)))
+
+    def generate_public_key(self):
+        """Generate a public key.
+
+        Returns:
+            (list): Public key, one 256-bit element per chain.
+
+        """
+        return [hash_chain(i, self.w - 1, self.hash_function) for i in self.private_key]
+
+    @staticmethod
+    def check_hash_function(hash_function):
+        """Get a hash function usable for the keys, whose digests are 256 bits long.
+
+        Args:
+            hash_function (None/str/HashFunction): Hash function, see hash_functions.get_hash_function().
+
+        Returns:
+            (HashFunction): Hash function.
+
+        """
+        hash_function = get_hash_function(hash_function)
+        if hash_function.digest_size != 32:
+            raise ValueError("Winternitz keys need a hash function with 256-bit digests.")
+        return hash_function
+
+    @staticmethod
+    def concatenate_key(key_list):
+        """Concatenate key.
+
+        Args:
+            key_list (list): Key or signature to concatenate.
+
+        Returns:
+            (bytearray): Concatenated key.
+
+        """
+        return bytearray(b"".join(key_list))
+
+    @staticmethod
+    def decatenate_key(key):
+        """Decatenate key.
+
+        Args:
+            key (bytearray): Key or signature to decatenate.
+
+        Returns:
+            (list): Decatenated key.
+
+        """
+        if len(key) % 32:
+            raise ValueError("Wrong key size.")
+        return [key[i:i + 32] for i in range(0, len(key), 32)]
+
+    def get_key(self, key_type, concatenate):
+        """Getter for the public or private key.
+
+        Args:
+            key_type (str): 'public' or 'private'.
+            concatenate (boolean): Concatenate key or not.
+
+        Returns:
+            (bytearray/list): Key.
+
+        """
+        key = self.public_key if key_type == 'public' else self.private_key
+        if not concatenate:
+            return key
+        return self.concatenate_key(key)
+
+    def sign(self, msg):
+        """Sign a message with the Winternitz signature.
+
+        Args:
+            msg (str): Message to sign.
+
+        Returns:
+            (list): Signature of the message, one 256-bit element per chain.
+
+        """
+        if self.used:
+            raise ValueError("Private and public keys already used!")
+        self.used = True
+        digits = self.message_digits(msg, self.w, self.hash_function)
+        return [hash_chain(x, digit, self.hash_function) for x, digit in zip(self.private_key, digits)]
+
+    @classmethod
+    def verify(cls, msg, signature, public_key, w=16, hash_function=None):
+        """Verify signature of the message.
+
+        The check stops at the first chain that does not lead to the public key.
+
+        Args:
+            msg (str): Message to check.
+            signature (list/bytes-like): Signature of the message, as a list or a contiguous buffer.
+            public_key (list/bytes-like): Public key, as a list or a contiguous buffer.
+            w (int): Winternitz parameter of the keys.
+            hash_function (None/str/HashFunction): Hash function of the keys, sha256 if None.
+
+        Returns:
+            (boolean): True if signature of the message is right otherwise False.
+
+        """
+        if type(signature) is not list:
+            signature = cls.decatenate_key(memoryview(signature))
+        if type(public_key) is not list:
+            public_key = cls.decatenate_key(memoryview(public_key))
+        hash_function = get_hash_function(hash_function)
+        digits = cls.message_digits(msg, w, hash_function)
+        if len(signature) != len(digits) or len(public_key) != len(digits):
+            return False
+        for sig, pub, digit in zip(signature, public_key, digits):
+            if hash_chain(sig, w - 1 - digit, hash_function) != pub:
+                return False
+        return True
+
+    @classmethod
+    def message_digits(cls, msg, w, hash_function=None):
+        """Base-w digits of the hash of the message followed by the ones of their checksum.
+
+        Args:
+            msg (str/bytes-like/os.PathLike/file object/iterable): Message, see HashFunction.hash_message().
+            w (int): Winternitz parameter.
+            hash_function (None/str/HashFunction): Hash function of the keys, sha256 if None.
+
+        Returns:
+            (list): Position in its chain of each signature element.
+
+        """
+        len1, len2 = chain_lengths(w)
+        value = int.from_bytes(get_hash_function(hash_function).hash_message(msg), 'big')
+        digits = [(value >> (256 - (i + 1) * (w.bit_length() - 1))) % w for i in range(len1)]
+        checksum = sum(w - 1 - i for i in digits)
+        digits.extend((checksum // w ** i) % w for i in reversed(range(len2)))
+        return digits
+
+    @staticmethod
+    def hash(data):
+        """Calculate sha256 hash of 'data', see 'hash_function' for the hash of a given key.
+
+        Args:
+            (str/bytes-like): Data to hash.
+
+        Returns:
+            (bytearray): bytes of the hash.
+
+        """
+        return SHA256(data)
+
+
+def main():
+    for msg_sent, msg_to_check in (("abc", "abc"), ("abc", "aaa"), ("abc", "aabc")):
+        winternitz = WinternitzSignature()
+        signature = winternitz.sign(msg_sent)
+        print(msg_sent, msg_to_check, WinternitzSignature.verify(msg_to_check, signature, winternitz.public_key))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""
+  Purpose:  Binary wire format of the Merkle signatures.
+  Created:  18/10/2026
+"""
+
+import struct
+from lamport import KEY_SIZE, SIGNATURE_SIZE
+
+
+MAGIC = b"MSIG"
+VERSION = 1
+HEADER = struct.Struct('>4sBBxxQI')  # Magic, version, path length, leaf index, message length.
+NODE_SIZE = 32
+
+
+def encode_signature(n_leaves, index, root, msg, signature):
+    """Encode a Merkle signature as header, root, one-time signature, Yi, path and message.
+
+    Args:
+        n_leaves (int): Number of leaves of the signer tree.
+        index (int): Leaf index of the signature.
+        root (bytes-like): Public key of the scheme.
+        msg (str/bytes-like): Signed message.
+        signature (list): [sig_prime, Yi, [auth(0), ..., auth(n-1)]], sig_prime as a list or a
+            contiguous buffer.
+
+    Returns:
+        (bytearray): Encoded signature.
+
+    """
+    sig_prime, public_key, auth = signature
+    if type(msg) is str:
+        msg = msg.encode('utf-8')
+    path_length = n_leaves.bit_length() - 1
+    if len(auth) != path_length or len(root) != NODE_SIZE:
+        raise ValueError("Wrong authentification path.")
+    parts = [HEADER.pack(MAGIC, VERSION, path_length, index, len(msg)), root]
+    parts.extend(sig_prime if type(sig_prime) is list else (sig_prime,))
+    parts.append(public_key)
+    parts.extend(auth)
+    parts.append(msg)
+    data = bytearray(b"".join(parts))
+    if len(data) != HEADER.size + NODE_SIZE * (1 + path_length) + SIGNATURE_SIZE + KEY_SIZE + len(msg):
+        raise ValueError("Wrong signature size.")
+    return data
+
+
+def decode_signature(data):
+    """Decode a Merkle signature without copying its blocks.
+
+    Args:
+        data (bytes-like): Encoded signature.
+
+    Returns:
+        (tuple): (n_leaves, index, root, msg, [sig_prime, Yi, [auth(0), ..., auth(n-1)]]), the
+            blocks and the message being memoryviews on 'data', the message bytes as signed.
+
+    """
+    view = memoryview(data)
+    if len(view) < HEADER.size:
+        raise ValueError("Truncated signature.")
+    magic, version, path_length, index, msg_length = HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a Merkle signature.")
+    offset = HEADER.size
+    sizes = [NODE_SIZE, SIGNATURE_SIZE, KEY_SIZE] + [NODE_SIZE] * path_length + [msg_length]
+    if len(view) != offset + sum(sizes):
+        raise ValueError("Wrong signature size.")
+    blocks = []
+    for size in sizes:
+        blocks.append(view[offset:offset + size])
+        offset += size
+    root, sig_prime, public_key = blocks[:3]
+    return 1 << path_length, index, root, blocks[-1], [sig_prime, public_key, blocks[3:-1]]